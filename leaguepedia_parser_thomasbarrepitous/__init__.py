@@ -25,6 +25,7 @@ from leaguepedia_parser_thomasbarrepitous.parsers.standings_parser import (
     get_standings,
     get_tournament_standings,
     get_team_standings,
+    get_many_team_standings,
     get_standings_by_overview_page,
 )
 
@@ -65,9 +66,12 @@ from leaguepedia_parser_thomasbarrepitous.parsers.contracts_parser import (
     get_contracts,
     get_player_contracts,
     get_team_contracts,
+    get_many_player_contracts,
+    get_many_team_contracts,
     get_active_contracts,
     get_expiring_contracts,
     get_contract_removals,
+    clear_contracts_cache,
 )
 
 # ScoreboardPlayers - Match Performance Statistics
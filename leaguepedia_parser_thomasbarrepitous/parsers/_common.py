@@ -0,0 +1,51 @@
+"""Helpers shared by the Cargo table parsers."""
+
+import functools
+import sys
+from typing import Dict, Iterable, List, Optional, TypeVar
+
+# slots=True is only accepted by dataclasses from Python 3.10 onwards
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+T = TypeVar("T")
+
+# Doubles single quotes in one C-level pass for Cargo string literals
+_SQL_QUOTE = str.maketrans({"'": "''"})
+
+
+@functools.lru_cache(maxsize=256)
+def escape_sql(value: str) -> str:
+    """Escapes single quotes for use inside a Cargo string literal.
+
+    Callers tend to repeat the same team/player filters across many queries, so
+    recent results are cached and interned.
+    """
+    return sys.intern(value.translate(_SQL_QUOTE))
+
+
+def in_condition(column: str, values: Iterable[str]) -> str:
+    """Builds an escaped `column IN ('a','b')` condition, dropping duplicates."""
+    escaped_values = ",".join(
+        "'" + escape_sql(value) + "'" for value in dict.fromkeys(values)
+    )
+    return f"{column} IN ({escaped_values})"
+
+
+def group_by_key(
+    items: Iterable[T], keys: Iterable[str], attribute: str
+) -> Dict[str, List[T]]:
+    """Groups items by the given attribute, with an entry for every key.
+
+    Items whose attribute is not one of the keys are dropped.
+    """
+    grouped = {key: [] for key in keys}
+    for item in items:
+        bucket = grouped.get(getattr(item, attribute))
+        if bucket is not None:
+            bucket.append(item)
+    return grouped
+
+
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """Interns low-cardinality strings so repeated values share one object."""
+    return sys.intern(value) if value else value
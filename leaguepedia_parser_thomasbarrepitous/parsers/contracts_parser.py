@@ -1,17 +1,50 @@
 import dataclasses
-from typing import List, Optional
-from datetime import datetime
-
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timezone
+
+from leaguepedia_parser_thomasbarrepitous.parsers._common import (
+    DATACLASS_SLOTS,
+    escape_sql,
+    group_by_key,
+    in_condition,
+    intern_str,
+)
 from leaguepedia_parser_thomasbarrepitous.site.leaguepedia import leaguepedia
 from leaguepedia_parser_thomasbarrepitous.transmuters.field_names import (
     contracts_fields,
 )
 
+# Cargo dates ("YYYY-MM-DD") and datetimes ("YYYY-MM-DDTHH:MM:SS[Z]", T or space)
+_ISO_DATETIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}):(\d{2}))?Z?$"
+).match
+
+# IsRemoval coercion: empty means unknown, "1" means removal, anything else does not
+_REMOVAL_MAP = {None: None, "": None, "0": False, "1": True, False: False, True: True}
+
+# Parenthesized so the OR does not swallow the other AND-ed conditions
+_EXCLUDE_REMOVALS = "(Contracts.IsRemoval IS NULL OR Contracts.IsRemoval='0')"
+_ONLY_REMOVALS = "Contracts.IsRemoval='1'"
+
+_ORDER_BY_END_DESC = "Contracts.ContractEnd DESC"
+_ORDER_BY_END_ASC = "Contracts.ContractEnd ASC"
 
-@dataclasses.dataclass
+# Opt-in cache for callers that poll the same query (see the cache_ttl arguments)
+_CACHE_MAX_SIZE = 128
+_query_cache: "OrderedDict[tuple, Tuple[float, list]]" = OrderedDict()
+_query_cache_lock = threading.Lock()
+
+
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class Contract:
     """Represents a contract from Leaguepedia's Contracts table.
 
+    Instances are immutable; use dataclasses.replace() to derive a modified copy.
+
     Attributes:
         player: Player name (String)
         team: Team name (String)
@@ -31,50 +64,123 @@ class Contract:
     @property
     def is_active(self) -> Optional[bool]:
         """Returns True if the contract is currently active (not expired and not a removal)."""
-        if self.is_removal:
-            return False
-        if self.contract_end:
-            return self.contract_end > datetime.now()
-        return None
+        return self.is_active_at()
 
     @property
     def is_expired(self) -> Optional[bool]:
         """Returns True if the contract has expired."""
-        if self.contract_end:
-            return self.contract_end <= datetime.now()
-        return None
+        return self.is_expired_at()
 
     @property
     def days_until_expiry(self) -> Optional[int]:
         """Returns the number of days until contract expiry (negative if expired)."""
+        return self.days_until_expiry_at()
+
+    def is_active_at(self, now: Optional[datetime] = None) -> Optional[bool]:
+        """Returns True if the contract is active at the given time (default: now)."""
+        if self.is_removal:
+            return False
         if self.contract_end:
-            delta = self.contract_end - datetime.now()
+            return self.contract_end > (now or datetime.now())
+        return None
+
+    def is_expired_at(self, now: Optional[datetime] = None) -> Optional[bool]:
+        """Returns True if the contract has expired at the given time (default: now)."""
+        if self.contract_end:
+            return self.contract_end <= (now or datetime.now())
+        return None
+
+    def days_until_expiry_at(self, now: Optional[datetime] = None) -> Optional[int]:
+        """Returns the number of days between the given time (default: now) and expiry."""
+        if self.contract_end:
+            delta = self.contract_end - (now or datetime.now())
             return delta.days
         return None
 
 
+def _parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
+    if not date_str or not isinstance(date_str, str):
+        return None
+    try:
+        # Fast path for the usual Cargo shapes
+        match = _ISO_DATETIME(date_str)
+        if match:
+            return datetime(
+                *[int(part) for part in match.groups() if part is not None]
+            )
+        # Other ISO forms, e.g. fractional seconds or a +00:00 offset
+        parsed = datetime.fromisoformat(date_str)
+    except ValueError:
+        return None
+    # Offsets are normalized to naive UTC, matching how a trailing Z is read
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _parse_contracts_bulk(rows: List[dict]) -> List[Contract]:
+    """Parses a full API response into Contract objects in a single pass."""
+    parse_datetime = _parse_datetime
+    removal_map_get = _REMOVAL_MAP.get
+    intern = intern_str
+
+    return [
+        Contract(
+            player=intern(row.get("Player")),
+            team=intern(row.get("Team")),
+            contract_end=parse_datetime(row.get("ContractEnd")),
+            contract_end_text=row.get("ContractEndText"),
+            is_removal=removal_map_get(row.get("IsRemoval"), False),
+            news_id=row.get("NewsId"),
+        )
+        for row in rows
+    ]
+
+
 def _parse_contract_data(data: dict) -> Contract:
     """Parses raw API response data into a Contract object."""
+    return _parse_contracts_bulk([data])[0]
+
+
+def _cached_query(
+    key: tuple, ttl: Optional[float], fetch: Callable[[], list]
+) -> list:
+    """Returns the result cached under key if younger than ttl seconds, else fetches it.
+
+    A ttl of None disables caching. The cache is a small LRU bounded by
+    _CACHE_MAX_SIZE. Keys that cannot be hashed (e.g. list-valued query parameters)
+    bypass the cache.
+    """
+    if ttl is None:
+        return fetch()
+
+    try:
+        with _query_cache_lock:
+            entry = _query_cache.get(key)
+    except TypeError:
+        return fetch()
+
+    now = time.monotonic()
+    if entry is not None and now - entry[0] < ttl:
+        with _query_cache_lock:
+            if key in _query_cache:
+                _query_cache.move_to_end(key)
+        return list(entry[1])
+
+    result = fetch()
+    with _query_cache_lock:
+        _query_cache[key] = (now, result)
+        _query_cache.move_to_end(key)
+        if len(_query_cache) > _CACHE_MAX_SIZE:
+            _query_cache.popitem(last=False)
 
-    def parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
-        try:
-            return datetime.fromisoformat(date_str) if date_str else None
-        except (ValueError, AttributeError):
-            return None
+    return list(result)
 
-    def parse_bool(value: Optional[str]) -> Optional[bool]:
-        if isinstance(value, bool):
-            return value
-        return value == "1" if value else None
 
-    return Contract(
-        player=data.get("Player"),
-        team=data.get("Team"),
-        contract_end=parse_datetime(data.get("ContractEnd")),
-        contract_end_text=data.get("ContractEndText"),
-        is_removal=parse_bool(data.get("IsRemoval")),
-        news_id=data.get("NewsId"),
-    )
+def clear_contracts_cache() -> None:
+    """Empties the cache used by contract queries made with a cache_ttl."""
+    with _query_cache_lock:
+        _query_cache.clear()
 
 
 def get_contracts(
@@ -83,6 +189,9 @@ def get_contracts(
     include_removals: bool = False,
     active_only: bool = False,
     limit: int = None,
+    players: Iterable[str] = None,
+    teams: Iterable[str] = None,
+    cache_ttl: Optional[float] = None,
     **kwargs,
 ) -> List[Contract]:
     """Returns contract information from Leaguepedia.
@@ -92,6 +201,12 @@ def get_contracts(
         team: Team name to filter by
         include_removals: Whether to include contract removal entries
         active_only: Whether to only return currently active contracts
+        limit: Maximum number of contracts to return
+        players: Several player names to fetch in one query (Player IN (...));
+            an empty iterable returns [] without querying
+        teams: Several team names to fetch in one query (Team IN (...));
+            an empty iterable returns [] without querying
+        cache_ttl: Seconds to serve an identical query from memory (default: no cache)
         **kwargs: Additional query parameters
 
     Returns:
@@ -100,47 +215,58 @@ def get_contracts(
     Raises:
         RuntimeError: If the Leaguepedia query fails
     """
+    # Materialized once so generators work; an empty list matches no contract
+    players = None if players is None else tuple(players)
+    teams = None if teams is None else tuple(teams)
+    if players == () or teams == ():
+        return []
+
     try:
+        # (selectivity rank, clause) pairs: equality predicates go first
         where_conditions = []
 
         if player:
-            escaped_player = player.replace("'", "''")
-            where_conditions.append(f"Contracts.Player='{escaped_player}'")
+            escaped_player = escape_sql(player)
+            where_conditions.append((0, f"Contracts.Player='{escaped_player}'"))
+
+        if players:
+            where_conditions.append((0, in_condition("Contracts.Player", players)))
 
         if team:
-            escaped_team = team.replace("'", "''")
-            where_conditions.append(f"Contracts.Team='{escaped_team}'")
+            escaped_team = escape_sql(team)
+            where_conditions.append((1, f"Contracts.Team='{escaped_team}'"))
 
-        if not include_removals:
-            where_conditions.append(
-                "Contracts.IsRemoval IS NULL OR Contracts.IsRemoval='0'"
-            )
+        if teams:
+            where_conditions.append((1, in_condition("Contracts.Team", teams)))
 
         if active_only:
             current_date = datetime.now().strftime("%Y-%m-%d")
-            where_conditions.append(f"Contracts.ContractEnd >= '{current_date}'")
-            where_conditions.append(
-                "Contracts.IsRemoval IS NULL OR Contracts.IsRemoval='0'"
-            )
+            where_conditions.append((2, f"Contracts.ContractEnd >= '{current_date}'"))
 
-        where_clause = " AND ".join(where_conditions) if where_conditions else None
+        if active_only or not include_removals:
+            where_conditions.append((3, _EXCLUDE_REMOVALS))
 
-        # Remove limit from kwargs to avoid conflicts with leaguepedia.query internal limit
-        clean_kwargs = kwargs.copy()
-        clean_kwargs.pop('limit', None)
-
-        contracts = leaguepedia.query(
-            tables="Contracts",
-            fields=",".join(contracts_fields),
-            where=where_clause,
-            order_by="Contracts.ContractEnd DESC",
-            **clean_kwargs,
+        where_clause = (
+            " AND ".join(clause for _, clause in sorted(where_conditions))
+            if where_conditions
+            else None
         )
 
-        parsed_contracts = [_parse_contract_data(contract) for contract in contracts]
-        
-        # Apply limit after parsing if specified
-        return parsed_contracts[:limit] if limit else parsed_contracts
+        # The limit is pushed down so the API only sends the rows we keep
+        return _cached_query(
+            ("contracts", where_clause, limit, tuple(sorted(kwargs.items()))),
+            cache_ttl,
+            lambda: _parse_contracts_bulk(
+                leaguepedia.query(
+                    tables="Contracts",
+                    fields=",".join(contracts_fields),
+                    where=where_clause,
+                    order_by=_ORDER_BY_END_DESC,
+                    limit=limit,
+                    **kwargs,
+                )
+            ),
+        )
 
     except Exception as e:
         raise RuntimeError(f"Failed to fetch contracts: {str(e)}")
@@ -175,6 +301,42 @@ def get_team_contracts(
     return get_contracts(team=team, active_only=active_only, **kwargs)
 
 
+def get_many_player_contracts(
+    players: List[str], **kwargs
+) -> Dict[str, List[Contract]]:
+    """Returns contracts for several players with a single API query.
+
+    Args:
+        players: Player names
+        **kwargs: Additional query parameters passed to get_contracts
+
+    Returns:
+        A dict mapping each player name to its list of Contract objects
+    """
+    players = list(players)
+    if not players:
+        return {}
+    return group_by_key(get_contracts(players=players, **kwargs), players, "player")
+
+
+def get_many_team_contracts(
+    teams: List[str], **kwargs
+) -> Dict[str, List[Contract]]:
+    """Returns contracts for several teams with a single API query.
+
+    Args:
+        teams: Team names
+        **kwargs: Additional query parameters passed to get_contracts
+
+    Returns:
+        A dict mapping each team name to its list of Contract objects
+    """
+    teams = list(teams)
+    if not teams:
+        return {}
+    return group_by_key(get_contracts(teams=teams, **kwargs), teams, "team")
+
+
 def get_active_contracts(team: str = None, **kwargs) -> List[Contract]:
     """Returns currently active contracts.
 
@@ -189,13 +351,19 @@ def get_active_contracts(team: str = None, **kwargs) -> List[Contract]:
 
 
 def get_expiring_contracts(
-    days: int = 30, team: str = None, **kwargs
+    days: int = 30,
+    team: str = None,
+    limit: int = None,
+    cache_ttl: Optional[float] = None,
+    **kwargs,
 ) -> List[Contract]:
     """Returns contracts expiring within the specified number of days.
 
     Args:
         days: Number of days to look ahead (default: 30)
         team: Team to filter by (optional)
+        limit: Maximum number of contracts to return, soonest expiry first (optional)
+        cache_ttl: Seconds to serve an identical query from memory (default: no cache)
         **kwargs: Additional query parameters
 
     Returns:
@@ -205,7 +373,7 @@ def get_expiring_contracts(
         where_conditions = []
 
         if team:
-            escaped_team = team.replace("'", "''")
+            escaped_team = escape_sql(team)
             where_conditions.append(f"Contracts.Team='{escaped_team}'")
 
         # Get contracts expiring within the specified days
@@ -217,61 +385,75 @@ def get_expiring_contracts(
 
         where_conditions.append(f"Contracts.ContractEnd >= '{current_date}'")
         where_conditions.append(f"Contracts.ContractEnd <= '{end_date_str}'")
-        where_conditions.append(
-            "Contracts.IsRemoval IS NULL OR Contracts.IsRemoval='0'"
-        )
+        where_conditions.append(_EXCLUDE_REMOVALS)
 
         where_clause = " AND ".join(where_conditions)
 
-        contracts = leaguepedia.query(
-            tables="Contracts",
-            fields=",".join(contracts_fields),
-            where=where_clause,
-            order_by="Contracts.ContractEnd ASC",
-            **kwargs,
+        return _cached_query(
+            ("expiring", where_clause, limit, tuple(sorted(kwargs.items()))),
+            cache_ttl,
+            lambda: _parse_contracts_bulk(
+                leaguepedia.query(
+                    tables="Contracts",
+                    fields=",".join(contracts_fields),
+                    where=where_clause,
+                    order_by=_ORDER_BY_END_ASC,
+                    limit=limit,
+                    **kwargs,
+                )
+            ),
         )
 
-        return [_parse_contract_data(contract) for contract in contracts]
-
     except Exception as e:
         raise RuntimeError(f"Failed to fetch expiring contracts: {str(e)}")
 
 
 def get_contract_removals(
-    player: str = None, team: str = None, **kwargs
+    player: str = None,
+    team: str = None,
+    limit: int = None,
+    cache_ttl: Optional[float] = None,
+    **kwargs,
 ) -> List[Contract]:
     """Returns contract removal entries.
 
     Args:
         player: Player to filter by (optional)
         team: Team to filter by (optional)
+        limit: Maximum number of removals to return (optional)
+        cache_ttl: Seconds to serve an identical query from memory (default: no cache)
         **kwargs: Additional query parameters
 
     Returns:
         A list of Contract objects representing removals
     """
     try:
-        where_conditions = ["Contracts.IsRemoval='1'"]
+        where_conditions = [_ONLY_REMOVALS]
 
         if player:
-            escaped_player = player.replace("'", "''")
+            escaped_player = escape_sql(player)
             where_conditions.append(f"Contracts.Player='{escaped_player}'")
 
         if team:
-            escaped_team = team.replace("'", "''")
+            escaped_team = escape_sql(team)
             where_conditions.append(f"Contracts.Team='{escaped_team}'")
 
         where_clause = " AND ".join(where_conditions)
 
-        contracts = leaguepedia.query(
-            tables="Contracts",
-            fields=",".join(contracts_fields),
-            where=where_clause,
-            order_by="Contracts.ContractEnd DESC",
-            **kwargs,
+        return _cached_query(
+            ("removals", where_clause, limit, tuple(sorted(kwargs.items()))),
+            cache_ttl,
+            lambda: _parse_contracts_bulk(
+                leaguepedia.query(
+                    tables="Contracts",
+                    fields=",".join(contracts_fields),
+                    where=where_clause,
+                    order_by=_ORDER_BY_END_DESC,
+                    limit=limit,
+                    **kwargs,
+                )
+            ),
         )
 
-        return [_parse_contract_data(contract) for contract in contracts]
-
     except Exception as e:
         raise RuntimeError(f"Failed to fetch contract removals: {str(e)}")
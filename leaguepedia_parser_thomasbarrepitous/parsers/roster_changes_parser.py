@@ -1,8 +1,14 @@
 import dataclasses
-from typing import List, Optional
+import functools
+from typing import Iterable, List, Optional
 from datetime import datetime, timedelta
 import enum
 
+from leaguepedia_parser_thomasbarrepitous.parsers._common import (
+    DATACLASS_SLOTS,
+    escape_sql,
+    intern_str,
+)
 from leaguepedia_parser_thomasbarrepitous.site.leaguepedia import leaguepedia
 from leaguepedia_parser_thomasbarrepitous.transmuters.field_names import (
     roster_changes_fields,
@@ -21,7 +27,20 @@ class RosterAction(enum.Enum):
     RETIREMENT = "Retirement"
 
 
-@dataclasses.dataclass
+# Built once so action_enum is a dict hit rather than an enum lookup per access.
+# Cargo records additions and removals as Join/Leave directions.
+_ACTION_BY_VALUE = {
+    **{action.value: action for action in RosterAction},
+    "Join": RosterAction.ADD,
+    "Leave": RosterAction.REMOVE,
+}
+
+
+# The field list never changes, so it is joined once rather than on every query
+_CARGO_FIELDS = ",".join(roster_changes_fields)
+
+
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class RosterChange:
     """Represents a roster change from Leaguepedia's RosterChanges table.
 
@@ -96,14 +115,18 @@ class RosterChange:
         return self.direction
 
     @property
-    def is_addition(self) -> bool:
-        """Returns True if this is an addition to the team (backward compatibility)."""
-        return self.is_join
+    def action_enum(self) -> Optional[RosterAction]:
+        """Returns the RosterAction matching this change, or None if unknown."""
+        return _ACTION_BY_VALUE.get(self.direction)
+
+    # Backward-compatible aliases share the property objects, avoiding a second lookup
+    is_addition = is_join
+    is_removal = is_leave
 
     @property
-    def is_removal(self) -> bool:
-        """Returns True if this is a removal from the team (backward compatibility)."""
-        return self.is_leave
+    def is_role_change(self) -> bool:
+        """Returns True if this change only updates the member's role."""
+        return self.direction == RosterAction.ROLE_CHANGE.value
 
     @property
     def is_retirement(self) -> Optional[bool]:
@@ -113,57 +136,175 @@ class RosterChange:
         return None
 
 
+# Cargo writes true boolean flags as "Yes"; anything else non-empty is False
+_TRUE = frozenset({"Yes", True})
+
+
+def _parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(date_str) if date_str else None
+    except (ValueError, AttributeError):
+        return None
+
+
+def _parse_bool(value: Optional[str]) -> Optional[bool]:
+    if value is None or value == "":
+        return None
+    return value in _TRUE
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value) if value and str(value).strip() else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_list(value: Optional[str], delimiter: str = ",") -> Optional[List[str]]:
+    if not value:
+        return None
+    return [item.strip() for item in value.split(delimiter) if item.strip()]
+
+
+def _parse_roster_changes_bulk(rows: List[dict]) -> List[RosterChange]:
+    """Parses a full API response into RosterChange objects in a single pass."""
+    parse_datetime = _parse_datetime
+    parse_bool = _parse_bool
+    parse_int = _parse_int
+    parse_list = _parse_list
+    intern = intern_str
+
+    return [
+        RosterChange(
+            date_sort=parse_datetime(row.get("Date_Sort")),
+            player=intern(row.get("Player")),
+            direction=intern(row.get("Direction")),
+            team=intern(row.get("Team")),
+            roles_ingame=parse_list(row.get("RolesIngame"), ";"),
+            roles_staff=parse_list(row.get("RolesStaff"), ";"),
+            roles=parse_list(row.get("Roles"), ";"),
+            role_display=row.get("RoleDisplay"),
+            role=intern(row.get("Role")),
+            role_modifier=row.get("RoleModifier"),
+            status=intern(row.get("Status")),
+            current_team_priority=parse_int(row.get("CurrentTeamPriority")),
+            player_unlinked=parse_bool(row.get("PlayerUnlinked")),
+            already_joined=row.get("AlreadyJoined"),
+            tournaments=parse_list(row.get("Tournaments")),
+            source=row.get("Source"),
+            is_gcd=parse_bool(row.get("IsGCD")),
+            preload=row.get("Preload"),
+            preload_sort_number=parse_int(row.get("PreloadSortNumber")),
+            tags=parse_list(row.get("Tags")),
+            news_id=row.get("NewsId"),
+            roster_change_id=row.get("RosterChangeId"),
+            n_line_in_news=parse_int(row.get("N_LineInNews")),
+        )
+        for row in rows
+    ]
+
+
 def _parse_roster_change_data(data: dict) -> RosterChange:
     """Parses raw API response data into a RosterChange object."""
+    return _parse_roster_changes_bulk([data])[0]
+
+
+def _direction_condition(actions: List[str]) -> str:
+    """Builds a Direction filter, using IN only when several actions are given."""
+    quoted = ["'" + escape_sql(action) + "'" for action in dict.fromkeys(actions)]
+    if len(quoted) == 1:
+        return f"RosterChanges.Direction={quoted[0]}"
+    return f"RosterChanges.Direction IN ({','.join(quoted)})"
+
+
+@functools.lru_cache(maxsize=None)
+def _where_template(
+    has_team: bool,
+    has_player: bool,
+    has_direction: bool,
+    has_tournament: bool,
+    has_start_date: bool,
+    has_end_date: bool,
+    is_retirement: Optional[bool],
+    is_gcd: Optional[bool],
+    player_unlinked: Optional[bool],
+) -> Optional[str]:
+    """Returns the WHERE format string for one combination of active filters."""
+    parts = []
+    if has_team:
+        parts.append("RosterChanges.Team='{team}'")
+    if has_player:
+        parts.append("RosterChanges.Player='{player}'")
+    if has_direction:
+        parts.append("{direction}")
+    if has_tournament:
+        parts.append("RosterChanges.Tournaments LIKE '%{tournament}%'")
+    if has_start_date:
+        parts.append("RosterChanges.Date_Sort >= '{start_date}'")
+    if has_end_date:
+        parts.append("RosterChanges.Date_Sort <= '{end_date}'")
+
+    # Boolean flags are filtered server-side rather than after parsing
+    for column, flag in (
+        ("IsRetirement", is_retirement),
+        ("IsGCD", is_gcd),
+        ("PlayerUnlinked", player_unlinked),
+    ):
+        if flag is not None:
+            parts.append(f"RosterChanges.{column}='{'Yes' if flag else 'No'}'")
+
+    return " AND ".join(parts) if parts else None
+
+
+def _query_roster_changes(
+    team: str = None,
+    player: str = None,
+    action: str = None,
+    tournament: str = None,
+    start_date: str = None,
+    end_date: str = None,
+    is_retirement: bool = None,
+    is_gcd: bool = None,
+    player_unlinked: bool = None,
+    actions: Iterable[str] = None,
+    **kwargs,
+) -> List[RosterChange]:
+    """Queries and parses RosterChanges; errors propagate unwrapped."""
+    directions = ([action] if action else []) + list(actions or [])
+    flags = tuple(
+        None if flag is None else bool(flag)
+        for flag in (is_retirement, is_gcd, player_unlinked)
+    )
+    template = _where_template(
+        bool(team),
+        bool(player),
+        bool(directions),
+        bool(tournament),
+        bool(start_date),
+        bool(end_date),
+        *flags,
+    )
 
-    def parse_datetime(date_str: Optional[str]) -> Optional[datetime]:
-        try:
-            return datetime.fromisoformat(date_str) if date_str else None
-        except (ValueError, AttributeError):
-            return None
-
-    def parse_bool(value: Optional[str]) -> Optional[bool]:
-        if isinstance(value, bool):
-            return value
-        return value == "Yes" if value else None
-
-    def parse_int(value: Optional[str]) -> Optional[int]:
-        try:
-            return int(value) if value and str(value).strip() else None
-        except (ValueError, TypeError):
-            return None
-
-    def parse_list(value: Optional[str], delimiter: str = ",") -> Optional[List[str]]:
-        if not value:
-            return None
-        return [item.strip() for item in value.split(delimiter) if item.strip()]
-
-    return RosterChange(
-        date_sort=parse_datetime(data.get("Date_Sort")),
-        player=data.get("Player"),
-        direction=data.get("Direction"),
-        team=data.get("Team"),
-        roles_ingame=parse_list(data.get("RolesIngame"), ";"),
-        roles_staff=parse_list(data.get("RolesStaff"), ";"),
-        roles=parse_list(data.get("Roles"), ";"),
-        role_display=data.get("RoleDisplay"),
-        role=data.get("Role"),
-        role_modifier=data.get("RoleModifier"),
-        status=data.get("Status"),
-        current_team_priority=parse_int(data.get("CurrentTeamPriority")),
-        player_unlinked=parse_bool(data.get("PlayerUnlinked")),
-        already_joined=data.get("AlreadyJoined"),
-        tournaments=parse_list(data.get("Tournaments")),
-        source=data.get("Source"),
-        is_gcd=parse_bool(data.get("IsGCD")),
-        preload=data.get("Preload"),
-        preload_sort_number=parse_int(data.get("PreloadSortNumber")),
-        tags=parse_list(data.get("Tags")),
-        news_id=data.get("NewsId"),
-        roster_change_id=data.get("RosterChangeId"),
-        n_line_in_news=parse_int(data.get("N_LineInNews")),
+    # Values are only substituted, so braces in them are never re-parsed
+    where_clause = template and template.format(
+        team=escape_sql(team) if team else "",
+        player=escape_sql(player) if player else "",
+        direction=_direction_condition(directions) if directions else "",
+        tournament=escape_sql(tournament) if tournament else "",
+        start_date=start_date or "",
+        end_date=end_date or "",
     )
 
+    changes = leaguepedia.query(
+        tables="RosterChanges",
+        fields=_CARGO_FIELDS,
+        where=where_clause,
+        order_by="RosterChanges.Date_Sort DESC",
+        **kwargs,
+    )
+
+    return _parse_roster_changes_bulk(changes)
+
 
 def get_roster_changes(
     team: str = None,
@@ -172,6 +313,10 @@ def get_roster_changes(
     tournament: str = None,
     start_date: str = None,
     end_date: str = None,
+    is_retirement: bool = None,
+    is_gcd: bool = None,
+    player_unlinked: bool = None,
+    actions: Iterable[str] = None,
     **kwargs,
 ) -> List[RosterChange]:
     """Returns roster change information from Leaguepedia.
@@ -183,6 +328,11 @@ def get_roster_changes(
         tournament: Tournament to filter by
         start_date: Start date for filtering (YYYY-MM-DD format)
         end_date: End date for filtering (YYYY-MM-DD format)
+        is_retirement: Only retirements (True) or non-retirements (False)
+        is_gcd: Filter on the IsGCD flag
+        player_unlinked: Filter on the PlayerUnlinked flag
+        actions: Several action types to match in one query, e.g. ["Join", "Leave"];
+            combined with action when both are given
         **kwargs: Additional query parameters
 
     Returns:
@@ -192,44 +342,20 @@ def get_roster_changes(
         RuntimeError: If the Leaguepedia query fails
     """
     try:
-        where_conditions = []
-
-        if team:
-            escaped_team = team.replace("'", "''")
-            where_conditions.append(f"RosterChanges.Team='{escaped_team}'")
-
-        if player:
-            escaped_player = player.replace("'", "''")
-            where_conditions.append(f"RosterChanges.Player='{escaped_player}'")
-
-        if action:
-            escaped_action = action.replace("'", "''")
-            where_conditions.append(f"RosterChanges.Direction='{escaped_action}'")
-
-        if tournament:
-            escaped_tournament = tournament.replace("'", "''")
-            where_conditions.append(
-                f"RosterChanges.Tournaments LIKE '%{escaped_tournament}%'"
-            )
-
-        if start_date:
-            where_conditions.append(f"RosterChanges.Date_Sort >= '{start_date}'")
-
-        if end_date:
-            where_conditions.append(f"RosterChanges.Date_Sort <= '{end_date}'")
-
-        where_clause = " AND ".join(where_conditions) if where_conditions else None
-
-        changes = leaguepedia.query(
-            tables="RosterChanges",
-            fields=",".join(roster_changes_fields),
-            where=where_clause,
-            order_by="RosterChanges.Date_Sort DESC",
+        return _query_roster_changes(
+            team=team,
+            player=player,
+            action=action,
+            tournament=tournament,
+            start_date=start_date,
+            end_date=end_date,
+            is_retirement=is_retirement,
+            is_gcd=is_gcd,
+            player_unlinked=player_unlinked,
+            actions=actions,
             **kwargs,
         )
 
-        return [_parse_roster_change_data(change) for change in changes]
-
     except Exception as e:
         raise RuntimeError(f"Failed to fetch roster changes: {str(e)}")
 
@@ -264,20 +390,22 @@ def get_player_roster_changes(player: str, **kwargs) -> List[RosterChange]:
 
 
 def get_recent_roster_changes(
-    days: int = 30, team: str = None, **kwargs
+    days: int = 30, team: str = None, now: Optional[datetime] = None, **kwargs
 ) -> List[RosterChange]:
     """Returns recent roster changes within the specified number of days.
 
     Args:
         days: Number of days to look back (default: 30)
         team: Team to filter by (optional)
+        now: Reference time for the window (default: the current time)
         **kwargs: Additional query parameters
 
     Returns:
         A list of recent RosterChange objects
     """
-    end_date = datetime.now().strftime("%Y-%m-%d")
-    start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    now = now or datetime.now()
+    end_date = now.date().isoformat()
+    start_date = (now - timedelta(days=days)).date().isoformat()
 
     return get_roster_changes(
         team=team, start_date=start_date, end_date=end_date, **kwargs
@@ -297,7 +425,9 @@ def get_roster_additions(
     Returns:
         A list of RosterChange objects representing additions
     """
-    return get_roster_changes(team=team, tournament=tournament, action="Join", **kwargs)
+    return get_roster_changes(
+        team=team, tournament=tournament, actions=["Join"], **kwargs
+    )
 
 
 def get_roster_removals(
@@ -314,7 +444,7 @@ def get_roster_removals(
         A list of RosterChange objects representing removals
     """
     return get_roster_changes(
-        team=team, tournament=tournament, action="Leave", **kwargs
+        team=team, tournament=tournament, actions=["Leave"], **kwargs
     )
 
 
@@ -322,24 +452,13 @@ def get_retirements(**kwargs) -> List[RosterChange]:
     """Returns player retirements.
 
     Args:
-        **kwargs: Additional query parameters
+        **kwargs: Filters and query parameters forwarded to get_roster_changes
 
     Returns:
         A list of RosterChange objects representing retirements
     """
-    # Use the specialized retirement filter
-    where_clause = "RosterChanges.IsRetirement='Yes'"
-
     try:
-        changes = leaguepedia.query(
-            tables="RosterChanges",
-            fields=",".join(roster_changes_fields),
-            where=where_clause,
-            order_by="RosterChanges.Date_Sort DESC",
-            **kwargs,
-        )
-
-        return [_parse_roster_change_data(change) for change in changes]
+        return _query_roster_changes(is_retirement=True, **kwargs)
 
     except Exception as e:
         raise RuntimeError(f"Failed to fetch retirements: {str(e)}")
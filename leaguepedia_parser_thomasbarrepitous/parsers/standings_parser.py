@@ -1,16 +1,40 @@
 import dataclasses
-from typing import List, Optional
-
+import functools
+from typing import Dict, Iterable, List, Optional
+
+from leaguepedia_parser_thomasbarrepitous.parsers._common import (
+    DATACLASS_SLOTS,
+    escape_sql,
+    group_by_key,
+    in_condition,
+)
 from leaguepedia_parser_thomasbarrepitous.site.leaguepedia import leaguepedia
 from leaguepedia_parser_thomasbarrepitous.transmuters.field_names import (
     standings_fields,
 )
 
 
-@dataclasses.dataclass
-class Standing:
+def _win_rate(wins: Optional[int], losses: Optional[int]) -> Optional[float]:
+    """Returns wins / (wins + losses) as a percentage, or None if it is undefined."""
+    if wins is not None and losses is not None:
+        total = wins + losses
+        if total > 0:
+            return (wins / total) * 100
+    return None
+
+
+class _WinRateSlots:
+    """Storage for Standing's precomputed win rates, outside its dataclass fields."""
+
+    __slots__ = ("_series_win_rate", "_game_win_rate")
+
+
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
+class Standing(_WinRateSlots):
     """Represents a team's standing from Leaguepedia's Standings table.
 
+    Instances are immutable; use dataclasses.replace() to derive a modified copy.
+
     Attributes:
         overview_page: Tournament overview page
         team: Team name
@@ -43,23 +67,30 @@ class Standing:
     streak: Optional[int] = None
     streak_direction: Optional[str] = None
 
+    def __post_init__(self):
+        # Instances are frozen, so rates computed once here cannot go stale
+        object.__setattr__(
+            self, "_series_win_rate", _win_rate(self.win_series, self.loss_series)
+        )
+        object.__setattr__(
+            self, "_game_win_rate", _win_rate(self.win_games, self.loss_games)
+        )
+
     @property
     def series_win_rate(self) -> Optional[float]:
-        """Calculate series win rate as a percentage."""
-        if self.win_series is not None and self.loss_series is not None:
-            total_series = self.win_series + self.loss_series
-            if total_series > 0:
-                return (self.win_series / total_series) * 100
-        return None
+        """Series win rate as a percentage; ties don't count."""
+        try:
+            return self._series_win_rate
+        except AttributeError:  # copies restored by pickle skip __post_init__
+            return _win_rate(self.win_series, self.loss_series)
 
     @property
     def game_win_rate(self) -> Optional[float]:
-        """Calculate game win rate as a percentage."""
-        if self.win_games is not None and self.loss_games is not None:
-            total_games = self.win_games + self.loss_games
-            if total_games > 0:
-                return (self.win_games / total_games) * 100
-        return None
+        """Game win rate as a percentage."""
+        try:
+            return self._game_win_rate
+        except AttributeError:  # copies restored by pickle skip __post_init__
+            return _win_rate(self.win_games, self.loss_games)
 
     @property
     def total_series_played(self) -> Optional[int]:
@@ -77,46 +108,74 @@ class Standing:
         return None
 
 
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return (
+            int(value)
+            if value and str(value).strip() and str(value).strip().isdigit()
+            else None
+        )
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value and str(value).strip() else None
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_standings_bulk(rows: List[dict]) -> List[Standing]:
+    """Parses a full API response into Standing objects in a single pass."""
+    parse_int = _parse_int
+    parse_float = _parse_float
+
+    return [
+        Standing(
+            overview_page=row.get("OverviewPage"),
+            team=row.get("Team"),
+            page_and_team=row.get("PageAndTeam"),
+            n=parse_int(row.get("N")),
+            place=parse_int(row.get("Place")),
+            win_series=parse_int(row.get("WinSeries")),
+            loss_series=parse_int(row.get("LossSeries")),
+            tie_series=parse_int(row.get("TieSeries")),
+            win_games=parse_int(row.get("WinGames")),
+            loss_games=parse_int(row.get("LossGames")),
+            points=parse_int(row.get("Points")),
+            points_tiebreaker=parse_float(row.get("PointsTiebreaker")),
+            streak=parse_int(row.get("Streak")),
+            streak_direction=row.get("StreakDirection"),
+        )
+        for row in rows
+    ]
+
+
 def _parse_standing_data(data: dict) -> Standing:
     """Parses raw API response data into a Standing object."""
+    return _parse_standings_bulk([data])[0]
 
-    def parse_int(value: Optional[str]) -> Optional[int]:
-        try:
-            return (
-                int(value)
-                if value and str(value).strip() and str(value).strip().isdigit()
-                else None
-            )
-        except (ValueError, TypeError):
-            return None
-
-    def parse_float(value: Optional[str]) -> Optional[float]:
-        try:
-            return float(value) if value and str(value).strip() else None
-        except (ValueError, TypeError):
-            return None
-
-    return Standing(
-        overview_page=data.get("OverviewPage"),
-        team=data.get("Team"),
-        page_and_team=data.get("PageAndTeam"),
-        n=parse_int(data.get("N")),
-        place=parse_int(data.get("Place")),
-        win_series=parse_int(data.get("WinSeries")),
-        loss_series=parse_int(data.get("LossSeries")),
-        tie_series=parse_int(data.get("TieSeries")),
-        win_games=parse_int(data.get("WinGames")),
-        loss_games=parse_int(data.get("LossGames")),
-        points=parse_int(data.get("Points")),
-        points_tiebreaker=parse_float(data.get("PointsTiebreaker")),
-        streak=parse_int(data.get("Streak")),
-        streak_direction=data.get("StreakDirection"),
-    )
+
+@functools.lru_cache(maxsize=None)
+def _where_template(
+    has_overview_page: bool, has_team: bool, has_teams: bool
+) -> Optional[str]:
+    """Returns the WHERE format string for one combination of active filters."""
+    parts = []
+    if has_overview_page:
+        parts.append("Standings.OverviewPage='{overview_page}'")
+    if has_team:
+        parts.append("Standings.Team='{team}'")
+    if has_teams:
+        parts.append("{teams}")
+    return " AND ".join(parts) if parts else None
 
 
 def get_standings(
     overview_page: str = None,
     team: str = None,
+    teams: Iterable[str] = None,
     **kwargs,
 ) -> List[Standing]:
     """Returns standings information from Leaguepedia.
@@ -124,6 +183,7 @@ def get_standings(
     Args:
         overview_page: Tournament overview page to filter by
         team: Team name to filter by
+        teams: Several team names to fetch in one query (Team IN (...))
         **kwargs: Additional query parameters
 
     Returns:
@@ -133,17 +193,15 @@ def get_standings(
         RuntimeError: If the Leaguepedia query fails
     """
     try:
-        where_conditions = []
-
-        if overview_page:
-            escaped_overview_page = overview_page.replace("'", "''")
-            where_conditions.append(f"Standings.OverviewPage='{escaped_overview_page}'")
-
-        if team:
-            escaped_team = team.replace("'", "''")
-            where_conditions.append(f"Standings.Team='{escaped_team}'")
-
-        where_clause = " AND ".join(where_conditions) if where_conditions else None
+        teams = list(teams or [])
+        template = _where_template(bool(overview_page), bool(team), bool(teams))
+
+        # Values are only substituted, so braces in them are never re-parsed
+        where_clause = template and template.format(
+            overview_page=escape_sql(overview_page) if overview_page else "",
+            team=escape_sql(team) if team else "",
+            teams=in_condition("Standings.Team", teams) if teams else "",
+        )
 
         standings = leaguepedia.query(
             tables="Standings",
@@ -153,7 +211,7 @@ def get_standings(
             **kwargs,
         )
 
-        return [_parse_standing_data(standing) for standing in standings]
+        return _parse_standings_bulk(standings)
 
     except Exception as e:
         raise RuntimeError(f"Failed to fetch standings: {str(e)}")
@@ -185,6 +243,25 @@ def get_team_standings(team: str, **kwargs) -> List[Standing]:
     return get_standings(team=team, **kwargs)
 
 
+def get_many_team_standings(
+    teams: List[str], **kwargs
+) -> Dict[str, List[Standing]]:
+    """Returns standings history for several teams with a single API query.
+
+    Args:
+        teams: Team names
+        **kwargs: Additional query parameters passed to get_standings
+
+    Returns:
+        A dict mapping each team name to its list of Standing objects
+    """
+    teams = list(teams)
+    if not teams:
+        return {}
+
+    return group_by_key(get_standings(teams=teams, **kwargs), teams, "team")
+
+
 def get_standings_by_overview_page(overview_page: str, **kwargs) -> List[Standing]:
     """Returns standings for a specific tournament overview page.
 
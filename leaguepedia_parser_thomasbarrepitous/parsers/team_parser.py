@@ -1,5 +1,6 @@
 import dataclasses
 from typing import Optional, List, Set
+from leaguepedia_parser_thomasbarrepitous.parsers._common import DATACLASS_SLOTS
 from leaguepedia_parser_thomasbarrepitous.site.leaguepedia import leaguepedia
 
 VALID_ROLES: Set[str] = {"Top", "Jungle", "Mid", "Bot", "Support"}
@@ -12,7 +13,7 @@ class TeamAssets:
     long_name: str  # Aka display name
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, **DATACLASS_SLOTS)
 class TeamPlayer:
     name: str
     role: str
@@ -1,6 +1,3 @@
-from mwrogue.esports_client import EsportsClient
-
-
 class LeaguepediaSite:
     """A ghost loaded class that handles Leaguepedia connection and some caching.
 
@@ -23,30 +20,48 @@ class LeaguepediaSite:
 
         Used for ghost loading the class during package import.
         """
+        # Imported here so that importing the package does not pay for mwrogue/mwclient
+        from mwrogue.esports_client import EsportsClient
+
         # If not, we create the self.client object as our way to interact with the wiki
         self._site = EsportsClient("lol")
 
-    def query(self, **kwargs) -> list:
+    def query(self, limit: int = None, **kwargs) -> list:
         """Issues a cargo query to leaguepedia.
 
         Params are usually:
             tables, join_on, fields, order_by, where
 
+        Args:
+            limit: Maximum number of rows to return. The row cap is sent to the API so
+                that only the needed pages are fetched. None fetches every page.
+
         Returns:
             List of rows from the query.
+
+        Raises:
+            ValueError: If limit is not a positive number.
         """
+        if limit is not None and limit <= 0:
+            raise ValueError(f"limit must be a positive number, got {limit}")
+
         result = []
 
-        # We check if we hit the API limit
-        while len(result) % self.limit == 0:
-            result.extend(
-                self.site.cargo_client.query(
-                    limit=self.limit, offset=len(result), **kwargs
-                )
+        while True:
+            if limit is None:
+                page_size = self.limit
+            else:
+                page_size = min(self.limit, limit - len(result))
+            if page_size <= 0:
+                break
+
+            page = self.site.cargo_client.query(
+                limit=page_size, offset=len(result), **kwargs
             )
+            result.extend(page)
 
-            # If the cargoquery is empty, we stop the loop
-            if not result:
+            # A short page means we reached the end of the results
+            if len(page) < page_size:
                 break
 
         return result
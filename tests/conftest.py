@@ -1,8 +1,15 @@
 """Shared test configuration and fixtures for Leaguepedia parser tests."""
 
+import collections
+import copy
+import dataclasses
+import functools
 import pytest
-from unittest.mock import Mock, patch
-from typing import Dict, List, Any
+from types import MappingProxyType
+from unittest.mock import MagicMock
+from typing import Dict, FrozenSet, List, Any
+
+from leaguepedia_parser_thomasbarrepitous.site.leaguepedia import leaguepedia
 
 # Test markers
 def pytest_configure(config):
@@ -13,6 +20,28 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "api: Tests that interact with external APIs")
 
 
+class _BenchmarkFallback:
+    """Stands in for pytest-benchmark when it is not installed."""
+
+    def pytest_configure(self, config):
+        config.addinivalue_line("markers", "benchmark: Benchmarks (untimed without pytest-benchmark)")
+
+    @pytest.fixture
+    def benchmark(self):
+        """Calls the benchmarked function once, untimed."""
+        return lambda func, *args, **kwargs: func(*args, **kwargs)
+
+
+def pytest_addoption(parser, pluginmanager):
+    """Accept the benchmark flags from addopts even without pytest-benchmark."""
+    if pluginmanager.hasplugin("benchmark"):
+        return
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark-disable", action="store_true", help="No-op without pytest-benchmark")
+    group.addoption("--benchmark-enable", action="store_true", help="No-op without pytest-benchmark")
+    pluginmanager.register(_BenchmarkFallback(), "benchmark-fallback")
+
+
 # Test Data Factories
 class TestDataFactory:
     """Factory for creating consistent test data across test modules."""
@@ -350,54 +379,123 @@ class TestDataFactory:
         ]
 
 
+def _freeze(rows: List[Dict[str, Any]]):
+    """Make a mock API response read-only so it can be shared between tests."""
+    return tuple(MappingProxyType(row) for row in rows)
+
+
 # Shared Fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_data_factory():
-    """Provide test data factory for all tests."""
+    """Provide test data factory for all tests; it is stateless, so one is shared."""
     return TestDataFactory
 
 
+# Built once per process: spec introspection of the query signature runs only here
+_QUERY_MOCK = MagicMock(spec=leaguepedia.query)
+
+
 @pytest.fixture
-def mock_leaguepedia_query():
+def mock_leaguepedia_query(monkeypatch):
     """Mock the leaguepedia query method."""
-    with patch('leaguepedia_parser_thomasbarrepitous.site.leaguepedia.leaguepedia.query') as mock:
-        yield mock
+    monkeypatch.setattr(leaguepedia, "query", _QUERY_MOCK)
+    yield _QUERY_MOCK
+    _QUERY_MOCK.reset_mock(return_value=True, side_effect=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def standings_mock_data(test_data_factory):
-    """Provide standings mock data."""
-    return test_data_factory.create_standings_mock_response()
+    """Provide standings mock data, frozen so it is safe to share across the session."""
+    return _freeze(test_data_factory.create_standings_mock_response())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def champions_mock_data(test_data_factory):
-    """Provide champions mock data."""
-    return test_data_factory.create_champions_mock_response()
+    """Provide champions mock data, frozen so it is safe to share across the session."""
+    return _freeze(test_data_factory.create_champions_mock_response())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def items_mock_data(test_data_factory):
-    """Provide items mock data."""
-    return test_data_factory.create_items_mock_response()
+    """Provide items mock data, frozen so it is safe to share across the session."""
+    return _freeze(test_data_factory.create_items_mock_response())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def roster_changes_mock_data(test_data_factory):
-    """Provide roster changes mock data."""
-    return test_data_factory.create_roster_changes_mock_response()
+    """Provide roster changes mock data, frozen so it is safe to share across the session."""
+    return _freeze(test_data_factory.create_roster_changes_mock_response())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def contracts_mock_data(test_data_factory):
-    """Provide contracts mock data."""
-    return test_data_factory.create_contracts_mock_response()
+    """Provide contracts mock data, built once and frozen so tests can share it."""
+    return _freeze(test_data_factory.create_contracts_mock_response())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scoreboard_players_mock_data(test_data_factory):
-    """Provide scoreboard players mock data."""
-    return test_data_factory.create_scoreboard_players_mock_response()
+    """Provide scoreboard players mock data, frozen so it is safe to share across the session."""
+    return _freeze(test_data_factory.create_scoreboard_players_mock_response())
+
+
+_SCOREBOARD_INDEX_COLUMNS = ("Link", "Team", "Champion", "Role", "GameId")
+
+
+@pytest.fixture(scope="session")
+def scoreboard_players_indexed(scoreboard_players_mock_data):
+    """Provide the scoreboard mock rows grouped as ``{column: {value: rows}}``."""
+    index = {column: collections.defaultdict(list) for column in _SCOREBOARD_INDEX_COLUMNS}
+    for row in scoreboard_players_mock_data:
+        for column, groups in index.items():
+            groups[row.get(column)].append(row)
+    return {
+        column: {value: tuple(rows) for value, rows in groups.items()}
+        for column, groups in index.items()
+    }
+
+
+@pytest.fixture(scope="module")
+def base_player():
+    """Provide an all-default ScoreboardPlayer to derive variants from with dataclasses.replace."""
+    from leaguepedia_parser_thomasbarrepitous.parsers.scoreboard_players_parser import (
+        ScoreboardPlayer,
+    )
+
+    return ScoreboardPlayer()
+
+
+@pytest.fixture(scope="module")
+def base_standing():
+    """Provide an all-default Standing to derive variants from with dataclasses.replace."""
+    from leaguepedia_parser_thomasbarrepitous.parsers.standings_parser import Standing
+
+    return Standing()
+
+
+@pytest.fixture(scope="module")
+def base_item():
+    """Provide a default-stat Item to derive variants from with dataclasses.replace."""
+    from leaguepedia_parser_thomasbarrepitous.parsers.items_parser import Item
+
+    return Item(name="TestItem")
+
+
+@pytest.fixture(scope="session")
+def cached_get_games():
+    """Provide get_games memoized per tournament for the session.
+
+    Several live tests fetch the same tournaments, so each one hits Leaguepedia once.
+    Callers get a deep copy because get_game_details fills in games in place.
+    """
+    import leaguepedia_parser_thomasbarrepitous as lp
+
+    fetch = functools.lru_cache(maxsize=None)(lp.get_games)
+
+    def get_games(tournament_name: str, **kwargs):
+        return copy.deepcopy(fetch(tournament_name, **kwargs))
+
+    return get_games
 
 
 # Constants for tests
@@ -434,11 +532,23 @@ def test_constants():
 
 
 # Helper functions for assertions
+@functools.lru_cache(maxsize=None)
+def _fields_of(cls) -> FrozenSet[str]:
+    """Return the dataclass field names and class attributes (e.g. properties) of cls."""
+    return frozenset(f.name for f in dataclasses.fields(cls)) | frozenset(dir(cls))
+
+
 def assert_valid_dataclass_instance(instance, expected_type, required_fields: List[str]):
     """Assert that an instance is a valid dataclass of expected type with required fields."""
     assert isinstance(instance, expected_type)
-    for field in required_fields:
-        assert hasattr(instance, field), f"Missing required field: {field}"
+    missing = set(required_fields) - _fields_of(expected_type)
+    assert not missing, f"Missing required fields: {sorted(missing)}"
+
+
+def assert_fields_set(instance, field_names: List[str]):
+    """Assert that none of the named fields is None on the instance."""
+    unset = [name for name in field_names if getattr(instance, name) is None]
+    assert not unset, f"Fields are None: {unset}"
 
 
 def assert_mock_called_with_table(mock_query, expected_table: str):
@@ -448,10 +558,33 @@ def assert_mock_called_with_table(mock_query, expected_table: str):
     assert call_args[1]['tables'] == expected_table
 
 
+def assert_where_contains(mock_query, *needles: str):
+    """Assert that the last query's WHERE clause contains every needle."""
+    where = mock_query.call_args.kwargs['where']
+    for needle in needles:
+        assert needle in where, f"{needle!r} not in WHERE clause {where!r}"
+
+
+def assert_fields_contain(mock_query, *needles: str):
+    """Assert that the last query's fields parameter contains every needle."""
+    fields = mock_query.call_args.kwargs['fields']
+    for needle in needles:
+        assert needle in fields, f"{needle!r} not in fields {fields!r}"
+
+
+def assert_query_kwarg(mock_query, name: str, expected):
+    """Assert that the last query was issued with the expected keyword argument."""
+    assert mock_query.call_args.kwargs[name] == expected
+
+
 # Export helpers for use in tests
 __all__ = [
     'TestDataFactory',
     'TestConstants', 
     'assert_valid_dataclass_instance',
-    'assert_mock_called_with_table'
+    'assert_fields_set',
+    'assert_mock_called_with_table',
+    'assert_where_contains',
+    'assert_fields_contain',
+    'assert_query_kwarg',
 ]
\ No newline at end of file
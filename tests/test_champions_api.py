@@ -0,0 +1,177 @@
+"""Tests for champions API functions in Leaguepedia parser."""
+
+import pytest
+
+import leaguepedia_parser_thomasbarrepitous as lp
+from leaguepedia_parser_thomasbarrepitous.parsers.champions_parser import Champion
+
+from .conftest import TestConstants, assert_mock_called_with_table
+
+
+class TestChampionsAPI:
+    """Test champions API functions with mocked data."""
+    
+    @pytest.mark.integration
+    def test_get_champions_basic_call(self, mock_leaguepedia_query, champions_mock_data):
+        """Test basic get_champions call returns properly parsed Champion objects."""
+        mock_leaguepedia_query.return_value = champions_mock_data
+        
+        champions = lp.get_champions()
+        
+        assert len(champions) == 2
+        assert all(isinstance(c, Champion) for c in champions)
+        assert champions[0].name == TestConstants.CHAMPION_JINX
+        assert champions[1].name == TestConstants.CHAMPION_YASUO
+        assert_mock_called_with_table(mock_leaguepedia_query, "Champions")
+    
+    @pytest.mark.integration
+    def test_get_champions_with_resource_filter(self, mock_leaguepedia_query, champions_mock_data):
+        """Test get_champions with resource filter."""
+        # Return only mana champions
+        filtered_data = [champions_mock_data[0]]  # Jinx uses Mana
+        mock_leaguepedia_query.return_value = filtered_data
+        
+        champions = lp.get_champions(resource="Mana")
+        
+        assert len(champions) == 1
+        assert champions[0].resource == "Mana"
+        mock_leaguepedia_query.assert_called_once()
+        # Verify WHERE clause includes resource filter
+        call_kwargs = mock_leaguepedia_query.call_args[1]
+        assert "Resource='Mana'" in call_kwargs['where']
+    
+    @pytest.mark.integration
+    def test_get_champions_with_attributes_filter(self, mock_leaguepedia_query, champions_mock_data):
+        """Test get_champions with attributes filter."""
+        # Return only marksman champions
+        filtered_data = [champions_mock_data[0]]  # Jinx is Marksman
+        mock_leaguepedia_query.return_value = filtered_data
+        
+        champions = lp.get_champions(attributes="Marksman")
+        
+        assert len(champions) == 1
+        assert "Marksman" in champions[0].attributes
+        mock_leaguepedia_query.assert_called_once()
+        # Verify WHERE clause uses LIKE for attributes
+        call_kwargs = mock_leaguepedia_query.call_args[1]
+        assert "LIKE '%Marksman%'" in call_kwargs['where']
+    
+    @pytest.mark.integration
+    def test_get_champion_by_name(self, mock_leaguepedia_query, champions_mock_data):
+        """Test get_champion_by_name returns single champion."""
+        # Return only Jinx
+        single_champion_data = [champions_mock_data[0]]
+        mock_leaguepedia_query.return_value = single_champion_data
+        
+        champion = lp.get_champion_by_name(TestConstants.CHAMPION_JINX)
+        
+        assert isinstance(champion, Champion)
+        assert champion.name == TestConstants.CHAMPION_JINX
+        mock_leaguepedia_query.assert_called_once()
+        # Verify exact name match in WHERE clause
+        call_kwargs = mock_leaguepedia_query.call_args[1]
+        assert f"Name='{TestConstants.CHAMPION_JINX}'" in call_kwargs['where']
+    
+    @pytest.mark.integration
+    def test_get_champion_by_name_not_found(self, mock_leaguepedia_query):
+        """Test get_champion_by_name returns None when champion not found."""
+        mock_leaguepedia_query.return_value = []
+        
+        champion = lp.get_champion_by_name("NonexistentChampion")
+        
+        assert champion is None
+    
+    @pytest.mark.integration
+    def test_get_champions_by_attributes(self, mock_leaguepedia_query, champions_mock_data):
+        """Test get_champions_by_attributes convenience function."""
+        filtered_data = [champions_mock_data[1]]  # Yasuo has Fighter,Assassin
+        mock_leaguepedia_query.return_value = filtered_data
+        
+        champions = lp.get_champions_by_attributes("Fighter")
+        
+        assert len(champions) == 1
+        assert "Fighter" in champions[0].attributes
+        assert_mock_called_with_table(mock_leaguepedia_query, "Champions")
+    
+    @pytest.mark.integration
+    def test_get_champions_by_resource(self, mock_leaguepedia_query, champions_mock_data):
+        """Test get_champions_by_resource convenience function."""
+        filtered_data = [champions_mock_data[1]]  # Yasuo uses Flow
+        mock_leaguepedia_query.return_value = filtered_data
+        
+        champions = lp.get_champions_by_resource("Flow")
+        
+        assert len(champions) == 1
+        assert champions[0].resource == "Flow"
+        assert_mock_called_with_table(mock_leaguepedia_query, "Champions")
+    
+    @pytest.mark.integration
+    def test_get_melee_champions(self, mock_leaguepedia_query, champions_mock_data):
+        """Test get_melee_champions filters correctly."""
+        mock_leaguepedia_query.return_value = champions_mock_data
+        
+        melee_champions = lp.get_melee_champions()
+        
+        # Should only return Yasuo (175 range <= 200)
+        assert len(melee_champions) == 1
+        assert melee_champions[0].name == TestConstants.CHAMPION_YASUO
+        assert melee_champions[0].is_melee is True
+    
+    @pytest.mark.integration
+    def test_get_ranged_champions(self, mock_leaguepedia_query, champions_mock_data):
+        """Test get_ranged_champions filters correctly."""
+        mock_leaguepedia_query.return_value = champions_mock_data
+        
+        ranged_champions = lp.get_ranged_champions()
+        
+        # Should only return Jinx (525 range > 200)
+        assert len(ranged_champions) == 1
+        assert ranged_champions[0].name == TestConstants.CHAMPION_JINX
+        assert ranged_champions[0].is_ranged is True
+
+class TestChampionsErrorHandling:
+    """Test error handling in champions functionality."""
+    
+    @pytest.mark.integration
+    def test_get_champions_api_error(self, mock_leaguepedia_query):
+        """Test that API errors are properly wrapped in RuntimeError."""
+        mock_leaguepedia_query.side_effect = Exception("API connection failed")
+        
+        with pytest.raises(RuntimeError, match="Failed to fetch champions"):
+            lp.get_champions()
+    
+    @pytest.mark.integration
+    def test_get_champion_by_name_api_error(self, mock_leaguepedia_query):
+        """Test that API errors in get_champion_by_name are handled."""
+        mock_leaguepedia_query.side_effect = Exception("API connection failed")
+        
+        with pytest.raises(RuntimeError, match=f"Failed to fetch champion {TestConstants.CHAMPION_JINX}"):
+            lp.get_champion_by_name(TestConstants.CHAMPION_JINX)
+    
+    @pytest.mark.integration
+    def test_get_champions_empty_response(self, mock_leaguepedia_query):
+        """Test handling of empty API response."""
+        mock_leaguepedia_query.return_value = []
+        
+        champions = lp.get_champions()
+        
+        assert champions == []
+        assert isinstance(champions, list)
+
+    @pytest.mark.integration
+    def test_champions_sql_injection_protection(self, mock_leaguepedia_query, champions_mock_data):
+        """Test that SQL injection attempts are properly escaped."""
+        mock_leaguepedia_query.return_value = champions_mock_data
+        
+        malicious_input = "'; DROP TABLE Champions; --"
+        
+        # Should not raise an exception and should escape the input
+        champions = lp.get_champions(resource=malicious_input)
+        
+        # Verify the input was escaped (single quotes doubled)
+        call_kwargs = mock_leaguepedia_query.call_args[1]
+        assert "''" in call_kwargs['where']  # Escaped single quotes
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -1,5 +1,6 @@
 """Tests for the contracts parser module."""
 
+import dataclasses
 import pytest
 from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
@@ -9,12 +10,23 @@ from leaguepedia_parser_thomasbarrepitous.parsers.contracts_parser import (
     get_contracts,
     get_player_contracts,
     get_team_contracts,
+    get_many_player_contracts,
+    get_many_team_contracts,
     get_active_contracts,
     get_expiring_contracts,
     get_contract_removals,
+    clear_contracts_cache,
     _parse_contract_data,
+    _parse_contracts_bulk,
+)
+from .conftest import (
+    TestConstants,
+    assert_fields_set,
+    assert_valid_dataclass_instance,
+    assert_where_contains,
+    assert_fields_contain,
+    assert_query_kwarg,
 )
-from .conftest import TestConstants, assert_valid_dataclass_instance
 
 
 class TestContractDataclass:
@@ -51,6 +63,18 @@ class TestContractDataclass:
         assert contract.is_removal is None
         assert contract.news_id is None
 
+    @pytest.mark.unit
+    def test_contract_is_immutable(self):
+        """Test Contract instances are frozen and can be copied with replace."""
+        contract = Contract(player="Faker", team="T1")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            contract.team = "G2 Esports"
+
+        moved = dataclasses.replace(contract, team="G2 Esports")
+        assert moved.team == "G2 Esports"
+        assert contract.team == "T1"
+
     @pytest.mark.unit
     def test_is_active_property(self):
         """Test the is_active property logic."""
@@ -116,6 +140,17 @@ class TestContractDataclass:
         no_date_contract = Contract()
         assert no_date_contract.days_until_expiry is None
 
+    @pytest.mark.unit
+    def test_properties_at_fixed_time(self):
+        """Test the *_at variants evaluate against the supplied time."""
+        now = datetime(2024, 6, 1)
+        contract = Contract(contract_end=datetime(2024, 6, 11), is_removal=False)
+
+        assert contract.is_active_at(now) is True
+        assert contract.is_expired_at(now) is False
+        assert contract.days_until_expiry_at(now) == 10
+        assert contract.is_active_at(datetime(2024, 7, 1)) is False
+
 
 class TestContractParser:
     """Test the contract parsing functions."""
@@ -184,6 +219,55 @@ class TestContractParser:
         assert contract.contract_end is None
         assert contract.is_removal is None
 
+    @pytest.mark.unit
+    def test_parse_contracts_bulk(self, contracts_mock_data):
+        """Test _parse_contracts_bulk matches the single-row parser."""
+        contracts = _parse_contracts_bulk(contracts_mock_data)
+
+        assert contracts == [_parse_contract_data(row) for row in contracts_mock_data]
+        assert [c.is_removal for c in contracts] == [False, False, True, False]
+
+    @pytest.mark.unit
+    def test_parse_contracts_bulk_interns_team_names(self):
+        """Test repeated team names share a single string object."""
+        rows = [{'Team': ''.join(['G2', ' Esports'])} for _ in range(2)]
+
+        first, second = _parse_contracts_bulk(rows)
+
+        assert first.team is second.team
+        assert _parse_contract_data({'Team': None}).team is None
+
+    @pytest.mark.unit
+    def test_parse_contract_data_date_formats(self):
+        """Test ISO timestamps parse to naive datetimes and plain dates still parse."""
+        with_z = _parse_contract_data({'ContractEnd': '2025-12-31T23:59:59Z'})
+        date_only = _parse_contract_data({'ContractEnd': '2025-12-31'})
+        spaced = _parse_contract_data({'ContractEnd': '2025-12-31 23:59:59'})
+        out_of_range = _parse_contract_data({'ContractEnd': '2025-13-31T00:00:00Z'})
+
+        assert with_z.contract_end == datetime(2025, 12, 31, 23, 59, 59)
+        assert with_z.contract_end.tzinfo is None
+        assert date_only.contract_end == datetime(2025, 12, 31)
+        assert spaced.contract_end == datetime(2025, 12, 31, 23, 59, 59)
+        assert out_of_range.contract_end is None
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "contract_end, expected",
+        [
+            ("2025-12-31T23:59:59+00:00", datetime(2025, 12, 31, 23, 59, 59)),
+            ("2025-12-31T23:59:59+02:00", datetime(2025, 12, 31, 21, 59, 59)),
+            ("2025-12-31T23:59:59.500000", datetime(2025, 12, 31, 23, 59, 59, 500000)),
+            ("2025-12-31T23:59:59.250+00:00", datetime(2025, 12, 31, 23, 59, 59, 250000)),
+        ],
+    )
+    def test_parse_contract_data_other_iso_formats(self, contract_end, expected):
+        """Test offsets and fractional seconds fall back to fromisoformat as naive UTC."""
+        contract = _parse_contract_data({'ContractEnd': contract_end})
+
+        assert contract.contract_end == expected
+        assert contract.contract_end.tzinfo is None
+
     @pytest.mark.unit
     def test_parse_contract_data_invalid_date(self):
         """Test parsing with invalid date format."""
@@ -216,13 +300,12 @@ class TestContractQueries:
         mock_leaguepedia_query.assert_called_once()
         
         # Verify the query parameters
-        call_args = mock_leaguepedia_query.call_args
-        assert call_args[1]['tables'] == 'Contracts'
+        assert_query_kwarg(mock_leaguepedia_query, 'tables', 'Contracts')
         # Check that all required fields are in the fields parameter
-        expected_fields = ['Player', 'Team', 'ContractEnd', 'ContractEndText', 'IsRemoval', 'NewsId']
-        actual_fields = call_args[1]['fields']
-        for field in expected_fields:
-            assert field in actual_fields
+        assert_fields_contain(
+            mock_leaguepedia_query,
+            'Player', 'Team', 'ContractEnd', 'ContractEndText', 'IsRemoval', 'NewsId',
+        )
 
     @pytest.mark.integration
     def test_get_contracts_by_player(self, mock_leaguepedia_query, contracts_mock_data):
@@ -238,8 +321,7 @@ class TestContractQueries:
         assert contracts[0].team == "T1"
         
         # Verify the where clause was used
-        call_args = mock_leaguepedia_query.call_args
-        assert "Contracts.Player='Faker'" in call_args[1]['where']
+        assert_where_contains(mock_leaguepedia_query, "Contracts.Player='Faker'")
 
     @pytest.mark.integration
     def test_get_contracts_by_team(self, mock_leaguepedia_query, contracts_mock_data):
@@ -254,8 +336,7 @@ class TestContractQueries:
         assert all(contract.team == "G2 Esports" for contract in contracts)
         
         # Verify the where clause was used
-        call_args = mock_leaguepedia_query.call_args
-        assert "Contracts.Team='G2 Esports'" in call_args[1]['where']
+        assert_where_contains(mock_leaguepedia_query, "Contracts.Team='G2 Esports'")
 
     @pytest.mark.integration
     def test_get_contracts_exclude_removals(self, mock_leaguepedia_query, contracts_mock_data):
@@ -270,8 +351,7 @@ class TestContractQueries:
         assert all(not contract.is_removal for contract in contracts)
         
         # Verify the where clause excludes removals
-        call_args = mock_leaguepedia_query.call_args
-        assert "IsRemoval IS NULL OR Contracts.IsRemoval='0'" in call_args[1]['where']
+        assert_where_contains(mock_leaguepedia_query, "IsRemoval IS NULL OR Contracts.IsRemoval='0'")
 
     @pytest.mark.integration
     def test_get_contracts_active_only(self, mock_leaguepedia_query, contracts_mock_data):
@@ -285,9 +365,27 @@ class TestContractQueries:
         contracts = get_contracts(active_only=True)
         
         # Verify the where clause includes date filter
-        call_args = mock_leaguepedia_query.call_args
-        assert "ContractEnd >=" in call_args[1]['where']
-        assert "IsRemoval IS NULL OR Contracts.IsRemoval='0'" in call_args[1]['where']
+        assert_where_contains(
+            mock_leaguepedia_query,
+            "ContractEnd >=",
+            "IsRemoval IS NULL OR Contracts.IsRemoval='0'",
+        )
+
+    @pytest.mark.integration
+    def test_get_contracts_where_clause_ordering(self, mock_leaguepedia_query):
+        """Test equality predicates come first and the removal filter appears once."""
+        mock_leaguepedia_query.return_value = []
+
+        get_contracts(player="Faker", team="T1", active_only=True)
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        assert_query_kwarg(
+            mock_leaguepedia_query,
+            'where',
+            "Contracts.Player='Faker' AND Contracts.Team='T1'"
+            f" AND Contracts.ContractEnd >= '{today}'"
+            " AND (Contracts.IsRemoval IS NULL OR Contracts.IsRemoval='0')",
+        )
 
     @pytest.mark.integration
     def test_get_contracts_sql_injection_protection(self, mock_leaguepedia_query, contracts_mock_data):
@@ -298,8 +396,17 @@ class TestContractQueries:
         get_contracts(player="Faker'; DROP TABLE Contracts; --")
         
         # Verify the quotes were escaped
-        call_args = mock_leaguepedia_query.call_args
-        assert "Faker''; DROP TABLE Contracts; --" in call_args[1]['where']
+        assert_where_contains(mock_leaguepedia_query, "Faker''; DROP TABLE Contracts; --")
+
+    @pytest.mark.integration
+    def test_get_contracts_limit_pushdown(self, mock_leaguepedia_query, contracts_mock_data):
+        """Test limit is forwarded to the API query instead of slicing afterwards."""
+        mock_leaguepedia_query.return_value = contracts_mock_data[:2]
+
+        contracts = get_contracts(limit=2)
+
+        assert len(contracts) == 2
+        assert_query_kwarg(mock_leaguepedia_query, 'limit', 2)
 
     @pytest.mark.integration
     def test_get_player_contracts(self, mock_leaguepedia_query, contracts_mock_data):
@@ -333,8 +440,72 @@ class TestContractQueries:
         contracts = get_team_contracts("G2 Esports", active_only=True)
         
         # Verify active_only was applied
-        call_args = mock_leaguepedia_query.call_args
-        assert "ContractEnd >=" in call_args[1]['where']
+        assert_where_contains(mock_leaguepedia_query, "ContractEnd >=")
+
+    @pytest.mark.integration
+    def test_get_contracts_by_players_in_clause(self, mock_leaguepedia_query):
+        """Test several players are fetched with one escaped IN condition."""
+        mock_leaguepedia_query.return_value = []
+
+        get_contracts(players=["Faker", "O'Neil", "Faker"], teams=["T1"])
+
+        mock_leaguepedia_query.assert_called_once()
+        assert_where_contains(
+            mock_leaguepedia_query,
+            "Contracts.Player IN ('Faker','O''Neil')",
+            "Contracts.Team IN ('T1')",
+        )
+
+    @pytest.mark.integration
+    def test_get_contracts_accepts_player_generator(self, mock_leaguepedia_query):
+        """Test a generator of players is consumed once into the IN condition."""
+        mock_leaguepedia_query.return_value = []
+
+        get_contracts(players=(name for name in ["Faker", "Caps"]))
+
+        assert_where_contains(mock_leaguepedia_query, "Contracts.Player IN ('Faker','Caps')")
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"players": []},
+            {"teams": []},
+            {"players": (name for name in [])},
+            {"teams": iter(())},
+        ],
+    )
+    def test_get_contracts_empty_in_filter_skips_query(self, mock_leaguepedia_query, kwargs):
+        """Test an empty players/teams filter returns [] instead of fetching every row."""
+        assert get_contracts(**kwargs) == []
+        mock_leaguepedia_query.assert_not_called()
+
+    @pytest.mark.integration
+    def test_get_many_player_contracts(self, mock_leaguepedia_query, contracts_mock_data):
+        """Test get_many_player_contracts maps each player to their contracts."""
+        mock_leaguepedia_query.return_value = [
+            c for c in contracts_mock_data if c['Player'] in ("Faker", "Caps")
+        ]
+
+        contracts = get_many_player_contracts(["Faker", "Caps", "Nobody"])
+
+        assert list(contracts) == ["Faker", "Caps", "Nobody"]
+        assert [c.player for c in contracts["Faker"]] == ["Faker"]
+        assert [c.player for c in contracts["Caps"]] == ["Caps"]
+        assert contracts["Nobody"] == []
+        mock_leaguepedia_query.assert_called_once()
+
+    @pytest.mark.integration
+    def test_get_many_team_contracts(self, mock_leaguepedia_query, contracts_mock_data):
+        """Test get_many_team_contracts maps each team to its contracts."""
+        mock_leaguepedia_query.return_value = contracts_mock_data
+
+        contracts = get_many_team_contracts(["G2 Esports", "T1"], include_removals=True)
+
+        assert len(contracts["G2 Esports"]) == 2
+        assert len(contracts["T1"]) == 1
+        assert get_many_team_contracts([]) == {}
+        mock_leaguepedia_query.assert_called_once()
 
     @pytest.mark.integration
     def test_get_active_contracts(self, mock_leaguepedia_query, contracts_mock_data):
@@ -347,8 +518,7 @@ class TestContractQueries:
         assert len(contracts) == 3
         
         # Verify active_only=True was used
-        call_args = mock_leaguepedia_query.call_args
-        assert "ContractEnd >=" in call_args[1]['where']
+        assert_where_contains(mock_leaguepedia_query, "ContractEnd >=")
 
     @pytest.mark.integration
     def test_get_expiring_contracts(self, mock_leaguepedia_query, contracts_mock_data):
@@ -360,10 +530,12 @@ class TestContractQueries:
         contracts = get_expiring_contracts(days=365)  # Look ahead 1 year
         
         # Verify the query includes date range
-        call_args = mock_leaguepedia_query.call_args
-        assert "ContractEnd >=" in call_args[1]['where']
-        assert "ContractEnd <=" in call_args[1]['where']
-        assert "IsRemoval IS NULL OR Contracts.IsRemoval='0'" in call_args[1]['where']
+        assert_where_contains(
+            mock_leaguepedia_query,
+            "ContractEnd >=",
+            "ContractEnd <=",
+            "IsRemoval IS NULL OR Contracts.IsRemoval='0'",
+        )
 
     @pytest.mark.integration
     def test_get_contract_removals(self, mock_leaguepedia_query, contracts_mock_data):
@@ -378,8 +550,7 @@ class TestContractQueries:
         assert contracts[0].player == "Jankos"
         
         # Verify the where clause filters for removals
-        call_args = mock_leaguepedia_query.call_args
-        assert "Contracts.IsRemoval='1'" in call_args[1]['where']
+        assert_where_contains(mock_leaguepedia_query, "Contracts.IsRemoval='1'")
 
     @pytest.mark.integration
     def test_get_contract_removals_by_player(self, mock_leaguepedia_query, contracts_mock_data):
@@ -395,6 +566,52 @@ class TestContractQueries:
         assert contracts[0].is_removal is True
 
 
+class TestContractCaching:
+    """Test the opt-in contracts query cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self):
+        """Start and end each caching test with an empty cache."""
+        clear_contracts_cache()
+        yield
+        clear_contracts_cache()
+
+    @pytest.mark.integration
+    def test_queries_are_not_cached_by_default(self, mock_leaguepedia_query, contracts_mock_data):
+        """Test repeated queries without cache_ttl always call the API."""
+        mock_leaguepedia_query.return_value = contracts_mock_data
+
+        get_contracts(player="Faker")
+        get_contracts(player="Faker")
+
+        assert mock_leaguepedia_query.call_count == 2
+
+    @pytest.mark.integration
+    def test_identical_queries_hit_cache(self, mock_leaguepedia_query, contracts_mock_data):
+        """Test a repeated query with cache_ttl is served without calling the API again."""
+        mock_leaguepedia_query.return_value = contracts_mock_data
+
+        first = get_player_contracts("Faker", cache_ttl=300)
+        second = get_contracts(player="Faker", cache_ttl=300)
+
+        assert first == second
+        mock_leaguepedia_query.assert_called_once()
+        assert "cache_ttl" not in mock_leaguepedia_query.call_args.kwargs
+
+    @pytest.mark.integration
+    def test_cache_clear_and_distinct_keys(self, mock_leaguepedia_query, contracts_mock_data):
+        """Test different arguments and clear_contracts_cache both trigger a new query."""
+        mock_leaguepedia_query.return_value = contracts_mock_data
+
+        get_contracts(player="Faker", cache_ttl=300)
+        get_contracts(player="Caps", cache_ttl=300)
+        assert mock_leaguepedia_query.call_count == 2
+
+        clear_contracts_cache()
+        get_contracts(player="Faker", cache_ttl=300)
+        assert mock_leaguepedia_query.call_count == 3
+
+
 class TestContractErrorHandling:
     """Test error handling in contract functions."""
 
@@ -448,6 +665,7 @@ class TestContractDataValidation:
                 Contract, 
                 ['player', 'team', 'contract_end', 'contract_end_text', 'is_removal', 'news_id']
             )
+            assert_fields_set(contract, ['player', 'team'])
 
     @pytest.mark.integration 
     def test_contracts_ordering(self, mock_leaguepedia_query, contracts_mock_data):
@@ -457,5 +675,4 @@ class TestContractDataValidation:
         get_contracts()
         
         # Verify order_by parameter
-        call_args = mock_leaguepedia_query.call_args
-        assert call_args[1]['order_by'] == 'Contracts.ContractEnd DESC'
\ No newline at end of file
+        assert_query_kwarg(mock_leaguepedia_query, 'order_by', 'Contracts.ContractEnd DESC')
\ No newline at end of file
@@ -1,6 +1,8 @@
 import pytest
 import leaguepedia_parser_thomasbarrepitous as leaguepedia_parser
 
+pytestmark = [pytest.mark.api]
+
 regions_names = ["China", "Europe", "Korea"]
 
 tournaments_names = [
@@ -33,8 +35,8 @@ def test_tournaments(region):
 
 
 @pytest.mark.parametrize("tournament_name", tournaments_names)
-def test_games(tournament_name):
-    games = leaguepedia_parser.get_games(tournament_name)
+def test_games(tournament_name, cached_get_games):
+    games = cached_get_games(tournament_name)
 
     assert len(games) > 0
 
@@ -46,8 +48,8 @@ def test_games(tournament_name):
 
 
 @pytest.mark.parametrize("tournament_name", tournaments_names)
-def test_get_details(tournament_name):
-    games = leaguepedia_parser.get_games(tournament_name)
+def test_get_details(tournament_name, cached_get_games):
+    games = cached_get_games(tournament_name)
     game = games[0]
 
     # First, test without pageId
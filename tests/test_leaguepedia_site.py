@@ -0,0 +1,47 @@
+"""Tests for the LeaguepediaSite query pagination."""
+
+import pytest
+from unittest.mock import Mock
+
+from leaguepedia_parser_thomasbarrepitous.site.leaguepedia import LeaguepediaSite
+
+
+def _site_with_rows(rows, page_size=2):
+    """Build a LeaguepediaSite whose cargo client serves rows page by page."""
+    site = LeaguepediaSite(limit=page_size)
+    site._site = Mock()
+    site._site.cargo_client.query.side_effect = (
+        lambda limit, offset, **kwargs: rows[offset : offset + limit]
+    )
+    return site
+
+
+class TestLeaguepediaSiteQuery:
+    """Test paging and limit pushdown in LeaguepediaSite.query."""
+
+    @pytest.mark.unit
+    def test_query_fetches_every_page(self):
+        """Test all pages are fetched, stopping on an empty final page."""
+        site = _site_with_rows(list(range(4)))
+
+        assert site.query(tables="Contracts") == [0, 1, 2, 3]
+        assert site._site.cargo_client.query.call_count == 3
+
+    @pytest.mark.unit
+    def test_query_limit_is_pushed_down(self):
+        """Test a limit caps both the rows returned and the page size requested."""
+        site = _site_with_rows(list(range(10)))
+
+        assert site.query(tables="Contracts", limit=3) == [0, 1, 2]
+        requested = [c.kwargs["limit"] for c in site._site.cargo_client.query.call_args_list]
+        assert requested == [2, 1]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("limit", [0, -1])
+    def test_query_rejects_non_positive_limit(self, limit):
+        """Test a zero or negative limit raises instead of silently returning nothing."""
+        site = _site_with_rows(list(range(4)))
+
+        with pytest.raises(ValueError):
+            site.query(tables="Contracts", limit=limit)
+        site._site.cargo_client.query.assert_not_called()
@@ -1,12 +1,19 @@
 """Tests for roster changes functionality in Leaguepedia parser."""
 
+import dataclasses
+import sys
+
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch
-from typing import List
 
 import leaguepedia_parser_thomasbarrepitous as lp
-from leaguepedia_parser_thomasbarrepitous.parsers.roster_changes_parser import RosterChange, RosterAction
+from leaguepedia_parser_thomasbarrepitous.parsers.roster_changes_parser import (
+    RosterAction,
+    RosterChange,
+    _parse_roster_changes_bulk,
+)
+from leaguepedia_parser_thomasbarrepitous.parsers._common import escape_sql
+from leaguepedia_parser_thomasbarrepitous.transmuters.field_names import roster_changes_fields
 
 from .conftest import TestConstants, assert_valid_dataclass_instance, assert_mock_called_with_table
 
@@ -101,43 +108,56 @@ class TestRosterChangeDataclass:
         assert change_none.action is None
     
     @pytest.mark.unit
-    def test_roster_change_is_addition_property(self):
-        """Test is_addition property."""
-        change_add = RosterChange(direction="Join")
-        assert change_add.is_addition is True
-        
-        change_remove = RosterChange(direction="Leave")
-        assert change_remove.is_addition is False
-        
-        change_none = RosterChange(direction=None)
-        assert change_none.is_addition is False
+    def test_roster_change_is_immutable(self):
+        """Test RosterChange instances are frozen and carry no per-instance dict."""
+        roster_change = RosterChange(player=TestConstants.PLAYER_FAKER)
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            roster_change.player = TestConstants.PLAYER_CAPS
+        if sys.version_info >= (3, 10):
+            assert not hasattr(roster_change, "__dict__")
     
     @pytest.mark.unit
-    def test_roster_change_is_removal_property(self):
-        """Test is_removal property."""
-        change_remove = RosterChange(direction="Leave")
-        assert change_remove.is_removal is True
-        
-        change_add = RosterChange(direction="Join")
-        assert change_add.is_removal is False
-        
-        change_none = RosterChange(direction=None)
-        assert change_none.is_removal is False
+    def test_roster_change_action_enum_property(self):
+        """Test action_enum maps directions and action names to RosterAction."""
+        assert RosterChange(direction="Join").action_enum is RosterAction.ADD
+        assert RosterChange(direction="Leave").action_enum is RosterAction.REMOVE
+        assert RosterChange(direction="Role Change").action_enum is RosterAction.ROLE_CHANGE
+        assert RosterChange(direction="Unknown").action_enum is None
+        assert RosterChange(direction=None).action_enum is None
     
     @pytest.mark.unit
-    def test_roster_change_boolean_field_handling(self):
+    @pytest.mark.parametrize("direction, is_addition, is_removal, is_role_change", [
+        ("Join", True, False, False),
+        ("join", True, False, False),
+        ("Leave", False, True, False),
+        ("Role Change", False, False, True),
+        (None, False, False, False),
+    ])
+    def test_roster_change_addition_removal_properties(
+        self, direction, is_addition, is_removal, is_role_change
+    ):
+        """Test is_addition, is_removal and is_role_change properties."""
+        change = RosterChange(direction=direction)
+        
+        assert change.is_addition is is_addition
+        assert change.is_removal is is_removal
+        assert change.is_role_change is is_role_change
+    
+    @pytest.mark.unit
+    @pytest.mark.parametrize("player_unlinked, is_gcd", [(True, False), (False, True)])
+    def test_roster_change_boolean_field_handling(self, player_unlinked, is_gcd):
         """Test boolean fields are properly handled."""
         roster_change = RosterChange(
-            player_unlinked=True,
-            is_gcd=False
+            player_unlinked=player_unlinked,
+            is_gcd=is_gcd
         )
         
-        assert roster_change.player_unlinked is True
-        assert roster_change.is_gcd is False
+        assert roster_change.player_unlinked is player_unlinked
+        assert roster_change.is_gcd is is_gcd
         # Test backward compatibility property
         assert roster_change.is_retirement is None  # Not available in real API
 
-
 class TestRosterChangesAPI:
     """Test roster changes API functions with mocked data."""
     
@@ -189,20 +209,22 @@ class TestRosterChangesAPI:
         assert f"Player='{TestConstants.PLAYER_FAKER}'" in call_kwargs['where']
     
     @pytest.mark.integration
-    def test_get_roster_changes_with_action_filter(self, mock_leaguepedia_query, roster_changes_mock_data):
-        """Test get_roster_changes with action filter."""
-        # Return only Join actions
-        filtered_data = [roster_changes_mock_data[0]]
-        mock_leaguepedia_query.return_value = filtered_data
+    @pytest.mark.parametrize("api, action, idx", [
+        (lambda: lp.get_roster_changes(action="Join"), "Join", 0),
+        (lambda: lp.get_roster_additions(), "Join", 0),
+        (lambda: lp.get_roster_removals(), "Leave", 1),
+    ], ids=["action_filter", "additions", "removals"])
+    def test_action_filters(self, mock_leaguepedia_query, roster_changes_mock_data, api, action, idx):
+        """Test the action filter and its addition/removal convenience functions."""
+        mock_leaguepedia_query.return_value = [roster_changes_mock_data[idx]]
         
-        changes = lp.get_roster_changes(action="Join")
+        changes = api()
         
         assert len(changes) == 1
-        assert changes[0].action == "Join"
+        assert changes[0].action == action
         mock_leaguepedia_query.assert_called_once()
-        # Verify WHERE clause includes action filter
         call_kwargs = mock_leaguepedia_query.call_args[1]
-        assert "Direction='Join'" in call_kwargs['where']
+        assert f"Direction='{action}'" in call_kwargs['where']
     
     @pytest.mark.integration
     def test_get_roster_changes_with_date_range(self, mock_leaguepedia_query, roster_changes_mock_data):
@@ -245,17 +267,11 @@ class TestRosterChangesAPI:
         assert_mock_called_with_table(mock_leaguepedia_query, "RosterChanges")
     
     @pytest.mark.integration
-    @patch('leaguepedia_parser_thomasbarrepitous.parsers.roster_changes_parser.datetime')
-    def test_get_recent_roster_changes(self, mock_datetime, mock_leaguepedia_query, roster_changes_mock_data):
-        """Test get_recent_roster_changes with mocked datetime."""
-        # Mock current time
-        mock_now = datetime(2023, 12, 15)
-        mock_datetime.now.return_value = mock_now
-        mock_datetime.timedelta = timedelta  # Use real timedelta
-        
+    def test_get_recent_roster_changes(self, mock_leaguepedia_query, roster_changes_mock_data):
+        """Test get_recent_roster_changes with an injected reference time."""
         mock_leaguepedia_query.return_value = roster_changes_mock_data
         
-        changes = lp.get_recent_roster_changes(days=30)
+        changes = lp.get_recent_roster_changes(days=30, now=datetime(2023, 12, 15))
         
         assert len(changes) == 2
         mock_leaguepedia_query.assert_called_once()
@@ -265,38 +281,6 @@ class TestRosterChangesAPI:
         assert "Date_Sort >= '2023-11-15'" in call_kwargs['where']  # 30 days before 2023-12-15
         assert "Date_Sort <= '2023-12-15'" in call_kwargs['where']
     
-    @pytest.mark.integration
-    def test_get_roster_additions(self, mock_leaguepedia_query, roster_changes_mock_data):
-        """Test get_roster_additions convenience function."""
-        # Return only additions
-        filtered_data = [roster_changes_mock_data[0]]
-        mock_leaguepedia_query.return_value = filtered_data
-        
-        additions = lp.get_roster_additions()
-        
-        assert len(additions) == 1
-        assert additions[0].action == "Join"
-        mock_leaguepedia_query.assert_called_once()
-        # Verify action filter
-        call_kwargs = mock_leaguepedia_query.call_args[1]
-        assert "Direction='Join'" in call_kwargs['where']
-    
-    @pytest.mark.integration
-    def test_get_roster_removals(self, mock_leaguepedia_query, roster_changes_mock_data):
-        """Test get_roster_removals convenience function."""
-        # Return only removals
-        filtered_data = [roster_changes_mock_data[1]]
-        mock_leaguepedia_query.return_value = filtered_data
-        
-        removals = lp.get_roster_removals()
-        
-        assert len(removals) == 1
-        assert removals[0].action == "Leave"
-        mock_leaguepedia_query.assert_called_once()
-        # Verify action filter
-        call_kwargs = mock_leaguepedia_query.call_args[1]
-        assert "Direction='Leave'" in call_kwargs['where']
-    
     @pytest.mark.integration
     def test_get_retirements(self, mock_leaguepedia_query):
         """Test get_retirements function with retirement filter."""
@@ -319,6 +303,72 @@ class TestRosterChangesAPI:
         call_kwargs = mock_leaguepedia_query.call_args[1]
         assert "IsRetirement='Yes'" in call_kwargs['where']
 
+    
+    @pytest.mark.integration
+    @pytest.mark.parametrize("kwargs, expected", [
+        ({"is_retirement": True}, "IsRetirement='Yes'"),
+        ({"is_retirement": False}, "IsRetirement='No'"),
+        ({"is_gcd": True}, "IsGCD='Yes'"),
+        ({"player_unlinked": False}, "PlayerUnlinked='No'"),
+    ])
+    def test_get_roster_changes_boolean_filters(self, mock_leaguepedia_query, kwargs, expected):
+        """Test that boolean filters are pushed into the WHERE clause."""
+        mock_leaguepedia_query.return_value = []
+        
+        lp.get_roster_changes(team=TestConstants.TEAM_T1, **kwargs)
+        
+        call_kwargs = mock_leaguepedia_query.call_args[1]
+        assert expected in call_kwargs['where']
+        assert f"Team='{TestConstants.TEAM_T1}'" in call_kwargs['where']
+
+    
+    @pytest.mark.integration
+    def test_get_roster_changes_with_multiple_actions(self, mock_leaguepedia_query, roster_changes_mock_data):
+        """Test that several actions are fetched with a single IN query."""
+        mock_leaguepedia_query.return_value = roster_changes_mock_data
+        
+        changes = lp.get_roster_changes(actions=["Join", "Leave"])
+        
+        assert [c.action for c in changes] == ["Join", "Leave"]
+        mock_leaguepedia_query.assert_called_once()
+        call_kwargs = mock_leaguepedia_query.call_args[1]
+        assert "Direction IN ('Join','Leave')" in call_kwargs['where']
+    
+    @pytest.mark.integration
+    def test_get_roster_changes_actions_are_escaped(self, mock_leaguepedia_query):
+        """Test that values in the actions list are escaped."""
+        mock_leaguepedia_query.return_value = []
+        
+        lp.get_roster_changes(actions=["Join", "Team Liquid's"])
+        
+        call_kwargs = mock_leaguepedia_query.call_args[1]
+        assert "Direction IN ('Join','Team Liquid''s')" in call_kwargs['where']
+
+    @pytest.mark.integration
+    def test_get_roster_changes_braces_in_values(self, mock_leaguepedia_query):
+        """Test that braces in filter values are not treated as template fields."""
+        mock_leaguepedia_query.return_value = []
+
+        lp.get_roster_changes(team="{team}", tournament="LCK {0}")
+
+        call_kwargs = mock_leaguepedia_query.call_args[1]
+        assert call_kwargs['where'] == (
+            "RosterChanges.Team='{team}' AND "
+            "RosterChanges.Tournaments LIKE '%LCK {0}%'"
+        )
+
+    @pytest.mark.integration
+    def test_get_roster_changes_reuses_field_list(self, mock_leaguepedia_query):
+        """Test that the Cargo field list is built once and reused across queries."""
+        mock_leaguepedia_query.return_value = []
+        
+        lp.get_roster_changes(team=TestConstants.TEAM_T1)
+        first_fields = mock_leaguepedia_query.call_args.kwargs['fields']
+        lp.get_roster_changes(player=TestConstants.PLAYER_FAKER)
+        
+        assert mock_leaguepedia_query.call_args.kwargs['fields'] is first_fields
+        assert set(first_fields.split(",")) == roster_changes_fields
+
 
 class TestRosterChangesErrorHandling:
     """Test error handling in roster changes functionality."""
@@ -336,8 +386,10 @@ class TestRosterChangesErrorHandling:
         """Test that API errors in get_retirements are handled."""
         mock_leaguepedia_query.side_effect = Exception("API connection failed")
         
-        with pytest.raises(RuntimeError, match="Failed to fetch retirements"):
+        with pytest.raises(RuntimeError) as excinfo:
             lp.get_retirements()
+
+        assert str(excinfo.value) == "Failed to fetch retirements: API connection failed"
     
     @pytest.mark.integration
     def test_get_roster_changes_empty_response(self, mock_leaguepedia_query):
@@ -372,13 +424,11 @@ class TestRosterChangesEdgeCases:
         assert roster_change.date is None
     
     @pytest.mark.unit
-    def test_roster_change_role_variations(self):
+    @pytest.mark.parametrize("role", ["Top", "Jungle", "Mid", "Bot", "Support", "Coach", "Substitute"])
+    def test_roster_change_role_variations(self, role):
         """Test RosterChange with various role values."""
-        roles = ["Top", "Jungle", "Mid", "Bot", "Support", "Coach", "Substitute"]
-        
-        for role in roles:
-            roster_change = RosterChange(role=role)
-            assert roster_change.role == role
+        roster_change = RosterChange(role=role)
+        assert roster_change.role == role
     
     @pytest.mark.integration
     def test_roster_changes_sql_injection_protection(self, mock_leaguepedia_query, roster_changes_mock_data):
@@ -393,6 +443,15 @@ class TestRosterChangesEdgeCases:
         # Verify the input was escaped (single quotes doubled)
         call_kwargs = mock_leaguepedia_query.call_args[1]
         assert "''" in call_kwargs['where']  # Escaped single quotes
+
+    @pytest.mark.unit
+    def test_escape_sql_reuses_escaped_values(self):
+        """Test that escaping the same value twice returns the cached string."""
+        first = escape_sql("Team Liquid's " + "Academy")
+        second = escape_sql("Team Liquid's Academy")
+
+        assert first == "Team Liquid''s Academy"
+        assert second is first
     
     @pytest.mark.unit
     def test_roster_change_additional_real_fields(self):
@@ -408,16 +467,11 @@ class TestRosterChangesEdgeCases:
         assert roster_change.already_joined == "Yes"
     
     @pytest.mark.integration
-    @patch('leaguepedia_parser_thomasbarrepitous.parsers.roster_changes_parser.datetime')
-    def test_get_recent_roster_changes_custom_days(self, mock_datetime, mock_leaguepedia_query, roster_changes_mock_data):
+    def test_get_recent_roster_changes_custom_days(self, mock_leaguepedia_query, roster_changes_mock_data):
         """Test get_recent_roster_changes with custom day count."""
-        mock_now = datetime(2023, 12, 15)
-        mock_datetime.now.return_value = mock_now
-        mock_datetime.timedelta = timedelta
-        
         mock_leaguepedia_query.return_value = roster_changes_mock_data
         
-        changes = lp.get_recent_roster_changes(days=7)  # Last 7 days
+        changes = lp.get_recent_roster_changes(days=7, now=datetime(2023, 12, 15))  # Last 7 days
         
         call_kwargs = mock_leaguepedia_query.call_args[1]
         assert "Date_Sort >= '2023-12-08'" in call_kwargs['where']  # 7 days before 2023-12-15
@@ -440,17 +494,28 @@ class TestRosterChangesDataParsing:
     """Test data parsing from API responses."""
     
     @pytest.mark.unit
-    def test_roster_change_boolean_parsing(self):
-        """Test that boolean fields are properly parsed."""
-        # This would typically test the internal parsing function
-        roster_change = RosterChange(
-            player_unlinked=True,
-            is_gcd=False
-        )
-        
-        assert isinstance(roster_change.player_unlinked, bool)
-        assert isinstance(roster_change.is_gcd, bool)
-    
+    @pytest.mark.parametrize(
+        "raw_value, expected",
+        [
+            ("Yes", True),
+            ("No", False),
+            ("1", False),
+            ("True", False),
+            (True, True),
+            (False, False),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_roster_change_boolean_parsing(self, raw_value, expected):
+        """Test that boolean fields are parsed from Cargo strings and Python bools."""
+        roster_change = _parse_roster_changes_bulk(
+            [{'PlayerUnlinked': raw_value, 'IsGCD': raw_value}]
+        )[0]
+
+        assert roster_change.player_unlinked is expected
+        assert roster_change.is_gcd is expected
+
     @pytest.mark.unit
     def test_roster_change_date_parsing(self):
         """Test date field parsing."""
@@ -460,6 +525,38 @@ class TestRosterChangesDataParsing:
         assert isinstance(roster_change.date, datetime)
         assert roster_change.date == test_date
 
+    
+    @pytest.mark.unit
+    def test_parse_roster_changes_bulk(self):
+        """Test that the bulk parser converts every field type in one pass."""
+        rows = [
+            {
+                'Date_Sort': '2023-11-15',
+                'Player': TestConstants.PLAYER_FAKER,
+                'Direction': 'Join',
+                'Team': TestConstants.TEAM_T1,
+                'RolesIngame': 'Mid; Sub',
+                'CurrentTeamPriority': '2',
+                'PlayerUnlinked': 'Yes',
+                'IsGCD': 'No',
+                'Tournaments': 'LCK 2024 Spring, LCK 2024 Summer',
+            },
+            {'Player': TestConstants.PLAYER_CAPS, 'PlayerUnlinked': '', 'IsGCD': 'Yes'},
+        ]
+        
+        first, second = _parse_roster_changes_bulk(rows)
+        
+        assert first.date_sort == datetime(2023, 11, 15)
+        assert first.roles_ingame == ['Mid', 'Sub']
+        assert first.current_team_priority == 2
+        assert first.player_unlinked is True
+        assert first.is_gcd is False
+        assert first.tournaments == ['LCK 2024 Spring', 'LCK 2024 Summer']
+        assert second.player == TestConstants.PLAYER_CAPS
+        assert second.player_unlinked is None
+        assert second.is_gcd is True
+        assert second.date_sort is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -1,5 +1,7 @@
 """Tests for the scoreboard players parser module."""
 
+import dataclasses
+
 import pytest
 from unittest.mock import Mock, patch
 
@@ -14,7 +16,23 @@ from leaguepedia_parser_thomasbarrepitous.parsers.scoreboard_players_parser impo
     get_role_performance_comparison,
     _parse_scoreboard_player_data,
 )
-from .conftest import TestConstants, assert_valid_dataclass_instance
+from .conftest import TestConstants, assert_fields_set, assert_valid_dataclass_instance
+
+
+_REQUIRED_FIELDS = ("link", "champion", "kills", "deaths", "assists", "gold")
+
+# WHERE predicates get_scoreboard_players emits per keyword filter
+_WHERE_FRAGMENTS = {
+    "tournament": "ScoreboardPlayers.OverviewPage='{}'",
+    "player": "ScoreboardPlayers.Link LIKE '%{}%'",
+    "team": "ScoreboardPlayers.Team='{}'",
+    "champion": "ScoreboardPlayers.Champion='{}'",
+    "role": "ScoreboardPlayers.Role='{}'",
+    "game_id": "ScoreboardPlayers.GameId='{}'",
+}
+
+_INJECTION_INPUT = "Faker'; DROP TABLE ScoreboardPlayers; --"
+_INJECTION_ESCAPED = "Faker''; DROP TABLE ScoreboardPlayers; --"
 
 
 class TestScoreboardPlayerDataclass:
@@ -59,144 +77,104 @@ class TestScoreboardPlayerDataclass:
         assert player.deaths is None
 
     @pytest.mark.unit
-    def test_player_name_property(self):
+    @pytest.mark.parametrize("link, expected", [
+        ("Faker", "Faker"),  # Standard name
+        ("Faker T1", "Faker"),  # Name with disambiguation
+        (None, None),  # No link
+    ])
+    def test_player_name_property(self, base_player, link, expected):
         """Test the player_name property extracts name from link."""
-        # Standard name
-        player = ScoreboardPlayer(link="Faker")
-        assert player.player_name == "Faker"
-
-        # Name with disambiguation
-        player = ScoreboardPlayer(link="Faker T1")
-        assert player.player_name == "Faker"
-
-        # No link
-        player = ScoreboardPlayer()
-        assert player.player_name is None
+        player = dataclasses.replace(base_player, link=link)
+        assert player.player_name == expected
 
     @pytest.mark.unit
-    def test_kda_ratio_property(self):
+    @pytest.mark.parametrize("kills, deaths, assists, expected", [
+        (8, 1, 12, 20.0),  # Normal KDA: (8 + 12) / 1
+        (5, 0, 10, float("inf")),  # Perfect KDA (no deaths)
+        (0, 3, 0, 0.0),  # Zero kills and assists with deaths
+        (None, 1, 5, None),  # Missing data
+    ])
+    def test_kda_ratio_property(self, base_player, kills, deaths, assists, expected):
         """Test the KDA ratio calculation."""
-        # Normal KDA
-        player = ScoreboardPlayer(kills=8, deaths=1, assists=12)
-        assert player.kda_ratio == 20.0  # (8 + 12) / 1
-
-        # Perfect KDA (no deaths)
-        player = ScoreboardPlayer(kills=5, deaths=0, assists=10)
-        assert player.kda_ratio == float("inf")
-
-        # Zero kills and assists with deaths
-        player = ScoreboardPlayer(kills=0, deaths=3, assists=0)
-        assert player.kda_ratio == 0.0
-
-        # Missing data
-        player = ScoreboardPlayer(kills=None, deaths=1, assists=5)
-        assert player.kda_ratio is None
+        player = dataclasses.replace(base_player, kills=kills, deaths=deaths, assists=assists)
+        assert player.kda_ratio == expected
 
     @pytest.mark.unit
-    def test_kill_participation_property(self):
+    @pytest.mark.parametrize("kills, assists, team_kills, expected", [
+        (8, 12, 25, 80.0),  # Normal participation: (8 + 12) / 25 * 100
+        (5, 15, 20, 100.0),  # Perfect participation
+        (5, 5, 0, None),  # Zero team kills
+        (None, 5, 10, None),  # Missing data
+    ])
+    def test_kill_participation_property(
+        self, base_player, kills, assists, team_kills, expected
+    ):
         """Test kill participation calculation."""
-        # Normal participation
-        player = ScoreboardPlayer(kills=8, assists=12, team_kills=25)
-        assert player.kill_participation == 80.0  # (8 + 12) / 25 * 100
-
-        # Perfect participation
-        player = ScoreboardPlayer(kills=5, assists=15, team_kills=20)
-        assert player.kill_participation == 100.0
-
-        # Zero team kills
-        player = ScoreboardPlayer(kills=5, assists=5, team_kills=0)
-        assert player.kill_participation is None
-
-        # Missing data
-        player = ScoreboardPlayer(kills=None, assists=5, team_kills=10)
-        assert player.kill_participation is None
+        player = dataclasses.replace(
+            base_player, kills=kills, assists=assists, team_kills=team_kills
+        )
+        assert player.kill_participation == expected
 
     @pytest.mark.unit
-    def test_gold_share_property(self):
+    def test_gold_share_property(self, base_player):
         """Test gold share calculation."""
         # Normal gold share
-        player = ScoreboardPlayer(gold=18500, team_gold=85000)
+        player = dataclasses.replace(base_player, gold=18500, team_gold=85000)
         assert abs(player.gold_share - 21.76) < 0.01  # 18500/85000 * 100
 
         # Zero team gold
-        player = ScoreboardPlayer(gold=10000, team_gold=0)
+        player = dataclasses.replace(base_player, gold=10000, team_gold=0)
         assert player.gold_share is None
 
         # Missing data
-        player = ScoreboardPlayer(gold=None, team_gold=85000)
+        player = dataclasses.replace(base_player, gold=None, team_gold=85000)
         assert player.gold_share is None
 
     @pytest.mark.unit
-    def test_did_win_property(self):
+    @pytest.mark.parametrize("player_win, expected", [
+        ("Yes", True),
+        ("true", True),
+        ("1", True),
+        ("No", False),
+        ("false", False),
+        (None, None),
+    ])
+    def test_did_win_property(self, base_player, player_win, expected):
         """Test the did_win property logic."""
-        # Win variations
-        player = ScoreboardPlayer(player_win="Yes")
-        assert player.did_win is True
-
-        player = ScoreboardPlayer(player_win="true")
-        assert player.did_win is True
-
-        player = ScoreboardPlayer(player_win="1")
-        assert player.did_win is True
-
-        # Loss variations
-        player = ScoreboardPlayer(player_win="No")
-        assert player.did_win is False
-
-        player = ScoreboardPlayer(player_win="false")
-        assert player.did_win is False
-
-        # No data
-        player = ScoreboardPlayer(player_win=None)
-        assert player.did_win is None
+        player = dataclasses.replace(base_player, player_win=player_win)
+        assert player.did_win is expected
 
     @pytest.mark.unit
-    def test_multikill_potential_property(self):
+    @pytest.mark.parametrize("kills, expected", [
+        (5, "Pentakill potential"),
+        (4, "Quadrakill potential"),
+        (3, "Triplekill potential"),
+        (2, "Doublekill potential"),
+        (1, "Standard performance"),
+        (None, None),
+    ])
+    def test_multikill_potential_property(self, base_player, kills, expected):
         """Test multikill potential assessment."""
-        player = ScoreboardPlayer(kills=5)
-        assert player.multikill_potential == "Pentakill potential"
-
-        player = ScoreboardPlayer(kills=4)
-        assert player.multikill_potential == "Quadrakill potential"
-
-        player = ScoreboardPlayer(kills=3)
-        assert player.multikill_potential == "Triplekill potential"
-
-        player = ScoreboardPlayer(kills=2)
-        assert player.multikill_potential == "Doublekill potential"
-
-        player = ScoreboardPlayer(kills=1)
-        assert player.multikill_potential == "Standard performance"
-
-        player = ScoreboardPlayer(kills=None)
-        assert player.multikill_potential is None
+        player = dataclasses.replace(base_player, kills=kills)
+        assert player.multikill_potential == expected
 
     @pytest.mark.unit
-    def test_performance_grade_property(self):
+    @pytest.mark.parametrize("kills, deaths, assists, team_kills, expected", [
+        (10, 1, 15, 30, "S"),  # KDA=25, KP=83%
+        (5, 2, 8, 20, "A"),  # KDA=6.5, KP=65%
+        (3, 2, 5, 15, "B"),  # KDA=4, KP=53%
+        (2, 2, 2, 10, "C"),  # KDA=2, KP=40%
+        (1, 5, 2, 10, "D"),  # KDA=0.6, KP=30%
+        (None, 2, 5, None, None),  # Missing data
+    ])
+    def test_performance_grade_property(
+        self, base_player, kills, deaths, assists, team_kills, expected
+    ):
         """Test performance grading system."""
-        # S grade
-        player = ScoreboardPlayer(kills=10, deaths=1, assists=15, team_kills=30)
-        assert player.performance_grade == "S"  # KDA=25, KP=83%
-
-        # A grade
-        player = ScoreboardPlayer(kills=5, deaths=2, assists=8, team_kills=20)
-        assert player.performance_grade == "A"  # KDA=6.5, KP=65%
-
-        # B grade
-        player = ScoreboardPlayer(kills=3, deaths=2, assists=5, team_kills=15)
-        assert player.performance_grade == "B"  # KDA=4, KP=53%
-
-        # C grade
-        player = ScoreboardPlayer(kills=2, deaths=2, assists=2, team_kills=10)
-        assert player.performance_grade == "C"  # KDA=2, KP=40%
-
-        # D grade
-        player = ScoreboardPlayer(kills=1, deaths=5, assists=2, team_kills=10)
-        assert player.performance_grade == "D"  # KDA=0.6, KP=30%
-
-        # Missing data
-        player = ScoreboardPlayer(kills=None, deaths=2, assists=5)
-        assert player.performance_grade is None
+        player = dataclasses.replace(
+            base_player, kills=kills, deaths=deaths, assists=assists, team_kills=team_kills
+        )
+        assert player.performance_grade == expected
 
 
 class TestScoreboardPlayerParser:
@@ -296,119 +274,50 @@ class TestScoreboardPlayerQueries:
         players = get_scoreboard_players()
 
         assert len(players) == 3
-        assert all(isinstance(player, ScoreboardPlayer) for player in players)
+        assert {type(player) for player in players} == {ScoreboardPlayer}
         mock_leaguepedia_query.assert_called_once()
 
         # Verify the query parameters
-        call_args = mock_leaguepedia_query.call_args
-        assert call_args[1]["tables"] == "ScoreboardPlayers"
-        expected_fields = ["Link", "Champion", "Kills", "Deaths", "Assists"]
-        actual_fields = call_args[1]["fields"]
-        for field in expected_fields:
-            assert field in actual_fields
-
-    @pytest.mark.integration
-    def test_get_scoreboard_players_by_tournament(
-        self, mock_leaguepedia_query, scoreboard_players_mock_data
-    ):
-        """Test getting scoreboard players for a specific tournament."""
-        mock_leaguepedia_query.return_value = scoreboard_players_mock_data
-
-        players = get_scoreboard_players(tournament="LCK/2024 Season/Summer Season")
-
-        assert len(players) == 3
-        assert all(
-            player.tournament == "LCK/2024 Season/Summer Season" for player in players
-        )
-
-        # Verify the where clause was used (should use OverviewPage, not Tournament)
-        call_args = mock_leaguepedia_query.call_args
-        assert "ScoreboardPlayers.OverviewPage='LCK/2024 Season/Summer Season'" in call_args[1]["where"]
-
-    @pytest.mark.integration
-    def test_get_scoreboard_players_by_player(
-        self, mock_leaguepedia_query, scoreboard_players_mock_data
-    ):
-        """Test getting scoreboard players for a specific player."""
-        faker_data = [p for p in scoreboard_players_mock_data if p["Link"] == "Faker"]
-        mock_leaguepedia_query.return_value = faker_data
-
-        players = get_scoreboard_players(player="Faker")
-
-        assert len(players) == 1
-        assert players[0].link == "Faker"
-
-        # Verify the where clause was used
-        call_args = mock_leaguepedia_query.call_args
-        assert "ScoreboardPlayers.Link LIKE '%Faker%'" in call_args[1]["where"]
-
-    @pytest.mark.integration
-    def test_get_scoreboard_players_by_team(
-        self, mock_leaguepedia_query, scoreboard_players_mock_data
-    ):
-        """Test getting scoreboard players for a specific team."""
-        t1_data = [p for p in scoreboard_players_mock_data if p["Team"] == "T1"]
-        mock_leaguepedia_query.return_value = t1_data
-
-        players = get_scoreboard_players(team="T1")
-
-        assert len(players) == 2  # Faker and Gumayusi
-        assert all(player.team == "T1" for player in players)
-
-        # Verify the where clause was used
-        call_args = mock_leaguepedia_query.call_args
-        assert "ScoreboardPlayers.Team='T1'" in call_args[1]["where"]
-
-    @pytest.mark.integration
-    def test_get_scoreboard_players_by_champion(
-        self, mock_leaguepedia_query, scoreboard_players_mock_data
-    ):
-        """Test getting scoreboard players for a specific champion."""
-        azir_data = [p for p in scoreboard_players_mock_data if p["Champion"] == "Azir"]
-        mock_leaguepedia_query.return_value = azir_data
-
-        players = get_scoreboard_players(champion="Azir")
-
-        assert len(players) == 1
-        assert players[0].champion == "Azir"
-
-        # Verify the where clause was used
-        call_args = mock_leaguepedia_query.call_args
-        assert "ScoreboardPlayers.Champion='Azir'" in call_args[1]["where"]
-
-    @pytest.mark.integration
-    def test_get_scoreboard_players_by_role(
-        self, mock_leaguepedia_query, scoreboard_players_mock_data
-    ):
-        """Test getting scoreboard players for a specific role."""
-        mid_data = [p for p in scoreboard_players_mock_data if p["Role"] == "Mid"]
-        mock_leaguepedia_query.return_value = mid_data
-
-        players = get_scoreboard_players(role="Mid")
-
-        assert len(players) == 2  # Faker and Chovy
-        assert all(player.role == "Mid" for player in players)
-
-        # Verify the where clause was used
-        call_args = mock_leaguepedia_query.call_args
-        assert "ScoreboardPlayers.Role='Mid'" in call_args[1]["where"]
+        kwargs = mock_leaguepedia_query.call_args.kwargs
+        assert kwargs["tables"] == "ScoreboardPlayers"
+        expected_fields = {
+            f"ScoreboardPlayers.{field}"
+            for field in ("Link", "Champion", "Kills", "Deaths", "Assists")
+        }
+        assert expected_fields <= set(kwargs["fields"].split(","))
 
     @pytest.mark.integration
-    def test_get_scoreboard_players_by_game_id(
-        self, mock_leaguepedia_query, scoreboard_players_mock_data
+    @pytest.mark.parametrize("kwargs, column, attr, expected_len", [
+        # Tournament filters on OverviewPage, not the Tournament column
+        pytest.param(
+            {"tournament": "LCK/2024 Season/Summer Season"}, None, "tournament", 3,
+            id="tournament",
+        ),
+        pytest.param({"player": "Faker"}, "Link", "link", 1, id="player"),
+        pytest.param({"team": "T1"}, "Team", "team", 2, id="team"),  # Faker and Gumayusi
+        pytest.param({"champion": "Azir"}, "Champion", "champion", 1, id="champion"),
+        pytest.param({"role": "Mid"}, "Role", "role", 2, id="role"),  # Faker and Chovy
+        pytest.param({"game_id": "GAME001"}, "GameId", "game_id", 3, id="game_id"),
+    ])
+    def test_get_scoreboard_players_by_filter(
+        self, mock_leaguepedia_query, scoreboard_players_mock_data,
+        scoreboard_players_indexed, kwargs, column, attr, expected_len,
     ):
-        """Test getting scoreboard players for a specific game."""
-        game_data = [p for p in scoreboard_players_mock_data if p["GameId"] == "GAME001"]
-        mock_leaguepedia_query.return_value = game_data
+        """Test getting scoreboard players filtered by a single query parameter."""
+        ((key, value),) = kwargs.items()
+        if column is None:
+            mock_leaguepedia_query.return_value = scoreboard_players_mock_data
+        else:
+            mock_leaguepedia_query.return_value = scoreboard_players_indexed[column][value]
 
-        players = get_scoreboard_players(game_id="GAME001")
+        players = get_scoreboard_players(**kwargs)
 
-        assert len(players) == 3
-        assert all(player.game_id == "GAME001" for player in players)
+        assert len(players) == expected_len
+        assert all(getattr(player, attr) == value for player in players)
 
         # Verify the where clause was used
-        call_args = mock_leaguepedia_query.call_args
-        assert "ScoreboardPlayers.GameId='GAME001'" in call_args[1]["where"]
+        where = mock_leaguepedia_query.call_args.kwargs["where"]
+        assert _WHERE_FRAGMENTS[key].format(value) in where
 
     @pytest.mark.integration
     def test_get_scoreboard_players_sql_injection_protection(
@@ -418,18 +327,18 @@ class TestScoreboardPlayerQueries:
         mock_leaguepedia_query.return_value = []
 
         # Try to inject SQL with quotes
-        get_scoreboard_players(player="Faker'; DROP TABLE ScoreboardPlayers; --")
+        get_scoreboard_players(player=_INJECTION_INPUT)
 
         # Verify the quotes were escaped
-        call_args = mock_leaguepedia_query.call_args
-        assert "Faker''; DROP TABLE ScoreboardPlayers; --" in call_args[1]["where"]
+        kwargs = mock_leaguepedia_query.call_args.kwargs
+        assert _INJECTION_ESCAPED in kwargs["where"]
 
     @pytest.mark.integration
     def test_get_player_match_history(
-        self, mock_leaguepedia_query, scoreboard_players_mock_data
+        self, mock_leaguepedia_query, scoreboard_players_indexed
     ):
         """Test get_player_match_history helper function."""
-        faker_data = [p for p in scoreboard_players_mock_data if p["Link"] == "Faker"]
+        faker_data = scoreboard_players_indexed["Link"]["Faker"]
         mock_leaguepedia_query.return_value = faker_data
 
         players = get_player_match_history("Faker", limit=5)
@@ -438,15 +347,15 @@ class TestScoreboardPlayerQueries:
         assert players[0].link == "Faker"
 
         # Verify player filter was applied (limit is handled post-query)
-        call_args = mock_leaguepedia_query.call_args
-        assert "ScoreboardPlayers.Link LIKE '%Faker%'" in call_args[1]["where"]
+        kwargs = mock_leaguepedia_query.call_args.kwargs
+        assert _WHERE_FRAGMENTS["player"].format("Faker") in kwargs["where"]
 
     @pytest.mark.integration
     def test_get_team_match_performance(
-        self, mock_leaguepedia_query, scoreboard_players_mock_data
+        self, mock_leaguepedia_query, scoreboard_players_indexed
     ):
         """Test get_team_match_performance helper function."""
-        t1_data = [p for p in scoreboard_players_mock_data if p["Team"] == "T1"]
+        t1_data = scoreboard_players_indexed["Team"]["T1"]
         mock_leaguepedia_query.return_value = t1_data
 
         players = get_team_match_performance("T1", tournament="LCK/2024 Season/Summer Season")
@@ -456,10 +365,10 @@ class TestScoreboardPlayerQueries:
 
     @pytest.mark.integration
     def test_get_champion_performance_stats(
-        self, mock_leaguepedia_query, scoreboard_players_mock_data
+        self, mock_leaguepedia_query, scoreboard_players_indexed
     ):
         """Test get_champion_performance_stats helper function."""
-        azir_data = [p for p in scoreboard_players_mock_data if p["Champion"] == "Azir"]
+        azir_data = scoreboard_players_indexed["Champion"]["Azir"]
         mock_leaguepedia_query.return_value = azir_data
 
         players = get_champion_performance_stats("Azir", role="Mid")
@@ -482,10 +391,10 @@ class TestScoreboardPlayerQueries:
 
     @pytest.mark.integration
     def test_get_role_performance_comparison(
-        self, mock_leaguepedia_query, scoreboard_players_mock_data
+        self, mock_leaguepedia_query, scoreboard_players_indexed
     ):
         """Test get_role_performance_comparison helper function."""
-        mid_data = [p for p in scoreboard_players_mock_data if p["Role"] == "Mid"]
+        mid_data = scoreboard_players_indexed["Role"]["Mid"]
         mock_leaguepedia_query.return_value = mid_data
 
         players = get_role_performance_comparison("LCK/2024 Season/Summer Season", "Mid")
@@ -528,11 +437,8 @@ class TestScoreboardPlayerDataValidation:
         players = get_scoreboard_players()
 
         for player in players:
-            assert_valid_dataclass_instance(
-                player,
-                ScoreboardPlayer,
-                ["link", "champion", "kills", "deaths", "assists", "gold"],
-            )
+            assert_valid_dataclass_instance(player, ScoreboardPlayer, _REQUIRED_FIELDS)
+            assert_fields_set(player, _REQUIRED_FIELDS)
 
     @pytest.mark.integration
     def test_scoreboard_players_ordering(
@@ -544,8 +450,8 @@ class TestScoreboardPlayerDataValidation:
         get_scoreboard_players()
 
         # Verify order_by parameter
-        call_args = mock_leaguepedia_query.call_args
-        assert call_args[1]["order_by"] == "ScoreboardPlayers.DateTime_UTC DESC"
+        kwargs = mock_leaguepedia_query.call_args.kwargs
+        assert kwargs["order_by"] == "ScoreboardPlayers.DateTime_UTC DESC"
 
 
 class TestScoreboardPlayerAdvancedFeatures:
@@ -557,8 +463,7 @@ class TestScoreboardPlayerAdvancedFeatures:
     ):
         """Test get_tournament_mvp_candidates function."""
         # Simulate multiple games for same players
-        extended_data = scoreboard_players_mock_data * 3  # Repeat data 3 times
-        mock_leaguepedia_query.return_value = extended_data
+        mock_leaguepedia_query.return_value = list(scoreboard_players_mock_data) * 3
 
         mvp_candidates = get_tournament_mvp_candidates(
             "LCK/2024 Season/Summer Season", min_games=2
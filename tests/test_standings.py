@@ -1,15 +1,26 @@
 """Tests for standings functionality in Leaguepedia parser."""
 
+import copy
+import dataclasses
+import pickle
+import sys
+
 import pytest
 from unittest.mock import Mock
 from typing import List
 
 import leaguepedia_parser_thomasbarrepitous as lp
-from leaguepedia_parser_thomasbarrepitous.parsers.standings_parser import Standing
+from leaguepedia_parser_thomasbarrepitous.parsers.standings_parser import (
+    Standing,
+    _parse_standings_bulk,
+)
 
 # Import helper functions from conftest
 from .conftest import TestConstants, assert_valid_dataclass_instance, assert_mock_called_with_table
 
+_MALICIOUS_INPUT = "'; DROP TABLE Standings; --"
+_MALICIOUS_WHERE = "Standings.Team='''; DROP TABLE Standings; --'"
+
 
 class TestStandingsImports:
     """Test that standings functions are properly importable."""
@@ -21,6 +32,7 @@ class TestStandingsImports:
             'get_standings',
             'get_tournament_standings', 
             'get_team_standings',
+            'get_many_team_standings',
             'get_standings_by_overview_page'
         ]
         
@@ -53,80 +65,149 @@ class TestStandingDataclass:
         assert standing.loss_series == 2
     
     @pytest.mark.unit
-    def test_standing_series_win_rate_calculation(self):
-        """Test series win rate is calculated correctly."""
-        standing = Standing(
-            team=TestConstants.TEAM_T1,
-            win_series=10,
-            loss_series=5,
-            tie_series=1
-        )
+    def test_standing_is_immutable(self, base_standing):
+        """Test Standing instances are frozen and carry no per-instance dict."""
+        standing = dataclasses.replace(base_standing, team=TestConstants.TEAM_T1)
         
-        # Win rate should be 10/(10+5) = 66.67% (ties don't count)
-        expected_win_rate = 66.67
-        assert standing.series_win_rate is not None
-        assert abs(standing.series_win_rate - expected_win_rate) < 0.1
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            standing.team = TestConstants.TEAM_GENG
+        if sys.version_info >= (3, 10):
+            assert not hasattr(standing, "__dict__")
     
     @pytest.mark.unit
-    def test_standing_game_win_rate_calculation(self):
-        """Test game win rate is calculated correctly."""
-        standing = Standing(
+    def test_standing_asdict_has_only_table_fields(self, base_standing):
+        """Test asdict() exposes exactly the Standings columns, without derived values."""
+        assert list(dataclasses.asdict(base_standing)) == [
+            "overview_page",
+            "team",
+            "page_and_team",
+            "n",
+            "place",
+            "win_series",
+            "loss_series",
+            "tie_series",
+            "win_games",
+            "loss_games",
+            "points",
+            "points_tiebreaker",
+            "streak",
+            "streak_direction",
+        ]
+
+    @pytest.mark.unit
+    def test_standing_win_rates_survive_copy_and_pickle(self, base_standing):
+        """Test precomputed win rates are kept by copies that skip __post_init__."""
+        standing = dataclasses.replace(
+            base_standing, win_series=3, loss_series=1, win_games=6, loss_games=2
+        )
+
+        for clone in (copy.copy(standing), pickle.loads(pickle.dumps(standing))):
+            assert clone == standing
+            assert clone.series_win_rate == 75.0
+            assert clone.game_win_rate == 75.0
+
+    @pytest.mark.unit
+    def test_standing_win_rates_follow_replace(self, base_standing):
+        """Test precomputed win rates are recomputed for copies made with replace()."""
+        standing = dataclasses.replace(
+            base_standing, win_series=3, loss_series=1, win_games=6, loss_games=2
+        )
+
+        updated = dataclasses.replace(standing, loss_series=3, loss_games=6)
+
+        assert standing.series_win_rate == 75.0
+        assert updated.series_win_rate == 50.0
+        assert updated.game_win_rate == 50.0
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "win_series, loss_series, tie_series, win_games, loss_games, "
+        "expected_series_rate, expected_game_rate",
+        [
+            # 10/(10+5) = 66.67% (ties don't count)
+            pytest.param(10, 5, 1, None, None, 66.67, None, id="series_ignores_ties"),
+            # 25/(25+15) = 62.5%
+            pytest.param(None, None, None, 25, 15, None, 62.5, id="games"),
+            pytest.param(10, 0, None, 20, 0, 100.0, 100.0, id="all_wins_no_losses"),
+            pytest.param(0, 10, None, 0, 20, 0.0, 0.0, id="all_losses_no_wins"),
+            pytest.param(0, 0, None, 0, 0, None, None, id="zero_totals"),
+        ],
+    )
+    def test_standing_win_rates(
+        self, base_standing, win_series, loss_series, tie_series, win_games,
+        loss_games, expected_series_rate, expected_game_rate,
+    ):
+        """Test series and game win rates are calculated correctly."""
+        standing = dataclasses.replace(
+            base_standing,
             team=TestConstants.TEAM_T1,
-            win_games=25,
-            loss_games=15
+            win_series=win_series,
+            loss_series=loss_series,
+            tie_series=tie_series,
+            win_games=win_games,
+            loss_games=loss_games,
         )
         
-        # Win rate should be 25/(25+15) = 62.5%
-        expected_win_rate = 62.5
-        assert standing.game_win_rate is not None
-        assert abs(standing.game_win_rate - expected_win_rate) < 0.1
+        for actual, expected in (
+            (standing.series_win_rate, expected_series_rate),
+            (standing.game_win_rate, expected_game_rate),
+        ):
+            if expected is None:
+                assert actual is None
+            else:
+                assert actual == pytest.approx(expected, abs=0.1)
     
     @pytest.mark.unit
-    def test_standing_total_series_calculation(self):
+    @pytest.mark.parametrize(
+        "win_series, loss_series, tie_series, expected",
+        [
+            pytest.param(10, 5, 2, 17, id="includes_ties"),  # 10 + 5 + 2
+            pytest.param(0, 0, None, 0, id="zero_totals"),
+        ],
+    )
+    def test_standing_total_series_calculation(
+        self, base_standing, win_series, loss_series, tie_series, expected
+    ):
         """Test total series played includes ties."""
-        standing = Standing(
-            win_series=10,
-            loss_series=5,
-            tie_series=2
+        standing = dataclasses.replace(
+            base_standing,
+            win_series=win_series,
+            loss_series=loss_series,
+            tie_series=tie_series
         )
         
-        assert standing.total_series_played == 17  # 10 + 5 + 2
+        assert standing.total_series_played == expected
     
     @pytest.mark.unit
-    def test_standing_total_games_calculation(self):
+    @pytest.mark.parametrize(
+        "win_games, loss_games, expected",
+        [
+            pytest.param(25, 15, 40, id="wins_and_losses"),  # 25 + 15
+            pytest.param(0, 0, 0, id="zero_totals"),
+        ],
+    )
+    def test_standing_total_games_calculation(
+        self, base_standing, win_games, loss_games, expected
+    ):
         """Test total games played calculation."""
-        standing = Standing(
-            win_games=25,
-            loss_games=15
+        standing = dataclasses.replace(
+            base_standing,
+            win_games=win_games,
+            loss_games=loss_games
         )
         
-        assert standing.total_games_played == 40  # 25 + 15
+        assert standing.total_games_played == expected
     
     @pytest.mark.unit
-    def test_standing_properties_with_none_values(self):
+    def test_standing_properties_with_none_values(self, base_standing):
         """Test that computed properties handle None values gracefully."""
-        standing = Standing(team=TestConstants.TEAM_T1)
+        standing = dataclasses.replace(base_standing, team=TestConstants.TEAM_T1)
         
         assert standing.series_win_rate is None
         assert standing.game_win_rate is None
         assert standing.total_series_played is None
         assert standing.total_games_played is None
     
-    @pytest.mark.unit
-    def test_standing_properties_with_zero_totals(self):
-        """Test computed properties when totals are zero."""
-        standing = Standing(
-            win_series=0,
-            loss_series=0,
-            win_games=0,
-            loss_games=0
-        )
-        
-        assert standing.series_win_rate is None  # Division by zero should return None
-        assert standing.game_win_rate is None    # Division by zero should return None
-        assert standing.total_series_played == 0
-        assert standing.total_games_played == 0
-
 
 class TestStandingsAPI:
     """Test standings API functions with mocked data."""
@@ -139,7 +220,7 @@ class TestStandingsAPI:
         standings = lp.get_standings()
         
         assert len(standings) == 2
-        assert all(isinstance(s, Standing) for s in standings)
+        assert {type(s) for s in standings} == {Standing}
         assert standings[0].team == TestConstants.TEAM_T1
         assert standings[1].team == TestConstants.TEAM_GENG
         assert_mock_called_with_table(mock_leaguepedia_query, "Standings")
@@ -196,6 +277,33 @@ class TestStandingsAPI:
         assert standings[0].team == TestConstants.TEAM_T1
         assert_mock_called_with_table(mock_leaguepedia_query, "Standings")
     
+    @pytest.mark.integration
+    def test_get_standings_by_teams_in_clause(self, mock_leaguepedia_query):
+        """Test several teams are fetched with one escaped, de-duplicated IN condition."""
+        mock_leaguepedia_query.return_value = []
+
+        lp.get_standings(teams=["T1", "Fnatic's", "T1"])
+
+        mock_leaguepedia_query.assert_called_once()
+        assert mock_leaguepedia_query.call_args.kwargs['where'] == (
+            "Standings.Team IN ('T1','Fnatic''s')"
+        )
+
+    @pytest.mark.integration
+    def test_get_many_team_standings(self, mock_leaguepedia_query, standings_mock_data):
+        """Test get_many_team_standings maps each team to its standings from one query."""
+        mock_leaguepedia_query.return_value = standings_mock_data
+
+        standings = lp.get_many_team_standings(
+            [TestConstants.TEAM_T1, TestConstants.TEAM_GENG, "Nobody"]
+        )
+
+        assert [s.team for s in standings[TestConstants.TEAM_T1]] == [TestConstants.TEAM_T1]
+        assert [s.team for s in standings[TestConstants.TEAM_GENG]] == [TestConstants.TEAM_GENG]
+        assert standings["Nobody"] == []
+        mock_leaguepedia_query.assert_called_once()
+        assert lp.get_many_team_standings([]) == {}
+
     @pytest.mark.integration
     def test_get_standings_by_overview_page(self, mock_leaguepedia_query, standings_mock_data):
         """Test get_standings_by_overview_page convenience function."""
@@ -240,41 +348,54 @@ class TestStandingsErrorHandling:
         assert standing.series_win_rate is None
         assert standing.game_win_rate is None
 
+    @pytest.mark.unit
+    def test_parse_standings_bulk_maps_every_field(self):
+        """Test the bulk parser puts each column in the matching field."""
+        row = {
+            "OverviewPage": TestConstants.LCK_2024_SUMMER,
+            "Team": TestConstants.TEAM_T1,
+            "PageAndTeam": f"{TestConstants.LCK_2024_SUMMER}_{TestConstants.TEAM_T1}",
+            "N": "1",
+            "Place": "2",
+            "WinSeries": "3",
+            "LossSeries": "4",
+            "TieSeries": "5",
+            "WinGames": "6",
+            "LossGames": "7",
+            "Points": "8",
+            "PointsTiebreaker": "9.5",
+            "Streak": "10",
+            "StreakDirection": "W",
+        }
+
+        (standing,) = _parse_standings_bulk([row])
+
+        assert standing == Standing(
+            overview_page=TestConstants.LCK_2024_SUMMER,
+            team=TestConstants.TEAM_T1,
+            page_and_team=f"{TestConstants.LCK_2024_SUMMER}_{TestConstants.TEAM_T1}",
+            n=1,
+            place=2,
+            win_series=3,
+            loss_series=4,
+            tie_series=5,
+            win_games=6,
+            loss_games=7,
+            points=8,
+            points_tiebreaker=9.5,
+            streak=10,
+            streak_direction="W",
+        )
+
 
 class TestStandingsEdgeCases:
     """Test edge cases and boundary conditions."""
     
     @pytest.mark.unit
-    def test_standing_with_all_wins_no_losses(self):
-        """Test win rate calculation when there are no losses."""
-        standing = Standing(
-            win_series=10,
-            loss_series=0,
-            win_games=20,
-            loss_games=0
-        )
-        
-        assert standing.series_win_rate == 100.0
-        assert standing.game_win_rate == 100.0
-    
-    @pytest.mark.unit
-    def test_standing_with_all_losses_no_wins(self):
-        """Test win rate calculation when there are no wins."""
-        standing = Standing(
-            win_series=0,
-            loss_series=10,
-            win_games=0,
-            loss_games=20
-        )
-        
-        assert standing.series_win_rate == 0.0
-        assert standing.game_win_rate == 0.0
-    
-    @pytest.mark.unit
-    def test_standing_with_special_characters_in_team_name(self):
+    def test_standing_with_special_characters_in_team_name(self, base_standing):
         """Test Standing with special characters in team name."""
         special_team_name = "Team Liquid'"
-        standing = Standing(team=special_team_name)
+        standing = dataclasses.replace(base_standing, team=special_team_name)
         
         assert standing.team == special_team_name
     
@@ -283,14 +404,22 @@ class TestStandingsEdgeCases:
         """Test that SQL injection attempts are properly escaped."""
         mock_leaguepedia_query.return_value = standings_mock_data
         
-        malicious_input = "'; DROP TABLE Standings; --"
-        
         # Should not raise an exception and should escape the input
-        standings = lp.get_standings(team=malicious_input)
-        
+        lp.get_standings(team=_MALICIOUS_INPUT)
+
         # Verify the input was escaped (single quotes doubled)
-        call_kwargs = mock_leaguepedia_query.call_args[1] 
-        assert "''" in call_kwargs['where']  # Escaped single quotes
+        assert mock_leaguepedia_query.call_args.kwargs['where'] == _MALICIOUS_WHERE
+
+    @pytest.mark.integration
+    def test_standings_combined_filters_where_clause(self, mock_leaguepedia_query):
+        """Test both filters are joined in order and braces in values are kept literally."""
+        mock_leaguepedia_query.return_value = []
+
+        lp.get_standings(overview_page="LCK {0}", team="{team}'s")
+
+        assert mock_leaguepedia_query.call_args.kwargs['where'] == (
+            "Standings.OverviewPage='LCK {0}' AND Standings.Team='{team}''s'"
+        )
 
 
 if __name__ == "__main__":
@@ -2,8 +2,10 @@ import pytest
 import leaguepedia_parser_thomasbarrepitous as leaguepedia_parser
 from leaguepedia_parser_thomasbarrepitous.parsers.team_parser import TeamPlayer
 
-@pytest.mark.parametrize("team_name", ["T1"])
-def test_get_active_players_current_date(team_name):
+pytestmark = [pytest.mark.api]
+
+def test_get_active_players_current_date():
+    team_name = "T1"
     # Change this test every new season :')
     assert (
             leaguepedia_parser.get_active_players(team_name) == 
@@ -16,8 +18,8 @@ def test_get_active_players_current_date(team_name):
             ]
     )
 
-@pytest.mark.parametrize("team_name", ["G2 Esports"])
-def test_get_active_players_from_date(team_name):
+def test_get_active_players_from_date():
+    team_name = "G2 Esports"
     assert (
             leaguepedia_parser.get_active_players(team_name, date="2019-01-01") == 
             [
@@ -30,8 +32,8 @@ def test_get_active_players_from_date(team_name):
     )
 
 
-@pytest.mark.parametrize("team_name", ["TSM"])
-def test_get_active_players_from_team_name_disbanded(team_name):
+def test_get_active_players_from_team_name_disbanded():
+    team_name = "TSM"
     assert (
             leaguepedia_parser.get_active_players(team_name) == 
             []